@@ -20,18 +20,21 @@ Usage:
 """
 
 import argparse
+import heapq
 import re
 import sqlite3
 import sys
+from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, TypedDict
+from typing import Literal, NamedTuple, TypedDict
 
 import instructor
 import numpy as np
 import yaml
 from openai import OpenAI
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
@@ -73,6 +76,44 @@ class ActionItem(BaseModel):
     related_files: list[str] = Field(default_factory=list, description="Mentioned file paths")
     blockers: list[str] | None = Field(default=None, description="Dependencies or blockers")
 
+    @field_validator("related_files")
+    @classmethod
+    def _intern_related_files(cls, value: list[str]) -> list[str]:
+        return _intern_files(value)
+
+    @field_validator("session_date")
+    @classmethod
+    def _share_session_date(cls, value: date) -> date:
+        # Dates are immutable; items from the same session share one instance
+        return _date(value.year, value.month, value.day)
+
+
+@lru_cache(maxsize=4096)
+def _date(year: int, month: int, day: int) -> date:
+    """Return a shared ``date`` instance for a calendar day."""
+    return date(year, month, day)
+
+
+def _intern_files(paths: list[str]) -> list[str]:
+    """Intern file paths so repeated hashing/equality checks hit identity fast paths."""
+    return [sys.intern(path) for path in paths]
+
+
+@lru_cache(maxsize=4096)
+def _canon(files: frozenset[str]) -> frozenset[str]:
+    """Return the canonical instance of a file set.
+
+    Equal sets seen while cached share one object, so equality can be `is`.
+    The pool is bounded; after eviction identity is merely a missed fast path.
+    """
+    return files
+
+
+@lru_cache(maxsize=4096)
+def _freeze(files: tuple[str, ...]) -> frozenset[str]:
+    """Return a shared frozenset for a canonical (sorted) tuple of file paths."""
+    return _canon(frozenset(files))
+
 
 # ============================================================================
 # Extraction Prompts
@@ -186,7 +227,7 @@ def extract_date_from_filename(filename: str) -> date:
     date_match = re.match(r"(\d{4})-(\d{2})-(\d{2})", filename)
     if date_match:
         year, month, day = map(int, date_match.groups())
-        return date(year, month, day)
+        return _date(year, month, day)
     return date.today()
 
 
@@ -674,7 +715,7 @@ def load_initiative_metadata(initiatives_dir: Path) -> list[dict[str, str]]:
                     "title": title,
                     "status": status,
                     "path": str(initiative_file),
-                    "related_files": related_files[:10],  # Limit to 10
+                    "related_files": _intern_files(related_files[:10]),  # Limit to 10
                 }
             )
         except Exception as e:
@@ -684,55 +725,227 @@ def load_initiative_metadata(initiatives_dir: Path) -> list[dict[str, str]]:
     return initiatives
 
 
+def build_initiative_index(file_sets: list[frozenset[str]]) -> dict[str, list[int]]:
+    """Build a reverse index from file path to the initiatives mentioning it.
+
+    Args:
+        file_sets: Related-file sets, one per initiative
+
+    Returns:
+        Mapping of file path to ascending initiative indices
+    """
+    index: dict[str, list[int]] = {}
+    for position, files in enumerate(file_sets):
+        for path in files:
+            index.setdefault(path, []).append(position)
+    return index
+
+
+@dataclass(slots=True)
+class InitiativeTable:
+    """Column-oriented initiative metadata for repeated mapping.
+
+    Transposes the ``list[dict]`` returned by ``load_initiative_metadata`` into
+    parallel lists so scoring loops index plain lists instead of hashing dict
+    keys for every initiative of every action item. ``file_index`` and the
+    per-initiative bitmasks are built on construction, and ``match_cache``
+    memoizes mapping results against this table, so treat the table as
+    read-only afterwards.
+    """
+
+    titles: list[str] = field(default_factory=list)
+    statuses: list[str] = field(default_factory=list)
+    paths: list[str] = field(default_factory=list)
+    file_sets: list[frozenset[str]] = field(default_factory=list)
+    file_index: dict[str, list[int]] = field(init=False, repr=False)
+    file_bits: dict[str, int] = field(init=False, repr=False)
+    file_masks: list[int] = field(init=False, repr=False)
+    match_cache: dict[tuple[frozenset[str], float, int | None], tuple["InitiativeMatch", ...]] = (
+        field(init=False, repr=False, compare=False)
+    )
+
+    def __post_init__(self) -> None:
+        self.match_cache = {}
+        self.file_sets = [_canon(files) for files in self.file_sets]
+        self.file_index = build_initiative_index(self.file_sets)
+        # One bit per distinct path; overlap becomes popcount(a & b)
+        self.file_bits = {path: 1 << bit for bit, path in enumerate(self.file_index)}
+        self.file_masks = [sum(self.file_bits[path] for path in files) for files in self.file_sets]
+
+    def mask_for(self, files: frozenset[str]) -> int:
+        """Encode a file set as a bitmask over the paths known to this table."""
+        file_bits = self.file_bits
+        return sum(file_bits[path] for path in files if path in file_bits)
+
+    @classmethod
+    def from_dicts(cls, initiatives: list[dict[str, str]]) -> "InitiativeTable":
+        """Build a table from initiative metadata dicts.
+
+        Args:
+            initiatives: Initiative metadata dicts (title, status, path, related_files)
+
+        Returns:
+            Table with one row per initiative, in input order
+        """
+        return cls(
+            titles=[initiative["title"] for initiative in initiatives],
+            statuses=[initiative["status"] for initiative in initiatives],
+            paths=[initiative.get("path", "") for initiative in initiatives],
+            file_sets=[
+                _freeze(tuple(sorted(_intern_files(initiative.get("related_files", [])))))
+                for initiative in initiatives
+            ],
+        )
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+
+class InitiativeMatch(NamedTuple):
+    """Initiative matched to an action item by file overlap."""
+
+    title: str
+    status: str
+    path: str
+    overlap_score: float
+    matching_files: tuple[str, ...]
+
+
+def _score_matches(
+    item_files: frozenset[str],
+    table: InitiativeTable,
+    min_score: float,
+    top_k: int | None,
+) -> tuple[InitiativeMatch, ...]:
+    """Score one file set against an initiative table."""
+    item_size = len(item_files)
+
+    item_mask = table.mask_for(item_files)
+    file_masks = table.file_masks
+
+    # Accepted rows are kept as parallel columns; match records are only
+    # materialized for the rows that survive ranking.
+    rows: list[int] = []
+    scores: list[float] = []
+
+    # Only initiatives sharing at least one file can score above zero
+    candidates = sorted(
+        {position for path in item_files for position in table.file_index.get(path, ())}
+    )
+
+    for index in candidates:
+        init_files = table.file_sets[index]
+        init_size = len(init_files)
+
+        # Upper bound on Jaccard: min(|A|, |B|) / max(|A|, |B|)
+        if min_score > 0.0 and min(item_size, init_size) / max(item_size, init_size) < min_score:
+            continue
+
+        # Canonical file sets make identical lists the same object
+        if init_files is item_files:
+            rows.append(index)
+            scores.append(1.0)
+            continue
+
+        # Compute Jaccard similarity on bitmasks: |A & B| / (|A| + |B| - |A & B|)
+        intersection = (item_mask & file_masks[index]).bit_count()
+        overlap_score = intersection / (item_size + init_size - intersection)
+
+        if overlap_score >= min_score:
+            rows.append(index)
+            scores.append(overlap_score)
+
+    # Sort by overlap score descending; a bounded heap avoids sorting the tail
+    positions = range(len(rows))
+    if top_k is not None:
+        ranked = heapq.nlargest(top_k, positions, key=scores.__getitem__)
+    else:
+        ranked = sorted(positions, key=scores.__getitem__, reverse=True)
+
+    matches = []
+    for position in ranked:
+        index = rows[position]
+        init_files = table.file_sets[index]
+
+        # Both sides usually hold 1-3 paths, where probing membership
+        # directly beats allocating an intersection set.
+        if item_size * len(init_files) <= 12:
+            common = tuple(path for path in item_files if path in init_files)
+        else:
+            common = tuple(item_files & init_files)
+
+        matches.append(
+            InitiativeMatch(
+                title=table.titles[index],
+                status=table.statuses[index],
+                path=table.paths[index],
+                overlap_score=scores[position],
+                matching_files=common,
+            )
+        )
+
+    return tuple(matches)
+
+
 def map_action_item_to_initiatives(
     item: ActionItem,
-    initiatives: list[dict[str, str]],
-) -> list[dict[str, float]]:
+    initiatives: list[dict[str, str]] | InitiativeTable,
+    min_score: float = 0.0,
+    top_k: int | None = None,
+) -> list[InitiativeMatch]:
     """Map an action item to relevant initiatives based on file overlap.
 
     MVP implementation for Phase 4. Uses simple file overlap heuristic.
     Full semantic matching deferred to Phase 5 integration.
 
+    When given an ``InitiativeTable``, results are memoized on that table per
+    item file set, so mapping many items with shared files against one table
+    skips the repeated set work. Matches are immutable, so each call returns
+    a fresh list over the shared memoized records.
+
     Args:
         item: Action item to map
-        initiatives: List of initiative metadata dicts
+        initiatives: Initiative metadata dicts, or a prebuilt ``InitiativeTable``
+            when mapping many items against the same initiatives
+        min_score: Minimum overlap score to report. When > 0, initiatives whose
+            best achievable Jaccard score falls below it are skipped without
+            computing the intersection.
+        top_k: Return only the ``top_k`` best matches (e.g. ``1`` when only the
+            best score for ``should_create_new_initiative`` is needed)
 
     Returns:
-        List of matches with initiative title and overlap score (0.0-1.0)
+        List of ``InitiativeMatch`` records, highest overlap score (0.0-1.0) first
     """
-    matches = []
-    item_files = set(item.related_files or [])
+    item_files = _freeze(tuple(sorted(item.related_files or [])))
 
     if not item_files:
-        return matches
-
-    for initiative in initiatives:
-        init_files = set(initiative.get("related_files", []))
+        return []
 
-        if not init_files:
-            continue
+    if not isinstance(initiatives, InitiativeTable):
+        # A one-off table would never be probed again, so skip the memo
+        return list(
+            _score_matches(item_files, InitiativeTable.from_dicts(initiatives), min_score, top_k)
+        )
 
-        # Compute Jaccard similarity
-        intersection = len(item_files & init_files)
-        union = len(item_files | init_files)
+    key = (item_files, min_score, top_k)
+    cached = initiatives.match_cache.get(key)
+    if cached is None:
+        cached = initiatives.match_cache[key] = _score_matches(
+            item_files, initiatives, min_score, top_k
+        )
 
-        if union > 0:
-            overlap_score = intersection / union
+    return list(cached)
 
-            if overlap_score > 0.0:
-                matches.append(
-                    {
-                        "title": initiative["title"],
-                        "status": initiative["status"],
-                        "overlap_score": overlap_score,
-                        "matching_files": list(item_files & init_files),
-                    }
-                )
 
-    # Sort by overlap score descending
-    matches.sort(key=lambda x: x["overlap_score"], reverse=True)
+NEW_INITIATIVE_MATCH_THRESHOLD = 0.3
 
-    return matches
+# (impact, confidence, has_strong_match) -> create new initiative
+_NEW_INITIATIVE_DECISIONS: dict[tuple[str, str, bool], bool] = {
+    (impact, confidence, has_match): (impact == "high" and confidence == "high" and not has_match)
+    for impact in ("low", "medium", "high")
+    for confidence in ("low", "medium", "high")
+    for has_match in (False, True)
+}
 
 
 def should_create_new_initiative(item: ActionItem, best_match_score: float = 0.0) -> bool:
@@ -749,7 +962,9 @@ def should_create_new_initiative(item: ActionItem, best_match_score: float = 0.0
     Returns:
         True if new initiative should be created
     """
-    return item.impact == "high" and item.confidence == "high" and best_match_score < 0.3
+    return _NEW_INITIATIVE_DECISIONS[
+        (item.impact, item.confidence, best_match_score >= NEW_INITIATIVE_MATCH_THRESHOLD)
+    ]
 
 
 # ============================================================================
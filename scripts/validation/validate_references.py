@@ -17,23 +17,61 @@ References:
 """
 
 import argparse
+import hashlib
+import mmap
+import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 # Project root
 ROOT = Path(__file__).parent.parent
 
+# Links that are not validated: external URLs, placeholder paths, and
+# same-file anchors (no validation needed here)
+_EXTERNAL_PREFIXES = ("http://", "https://", "mailto:", "ftp://", "tel:")
+_PLACEHOLDER_PREFIXES = ("path/to/", "relative/path/to")
+_IGNORED_PREFIXES = (*_EXTERNAL_PREFIXES, *_PLACEHOLDER_PREFIXES, "#")
 
-def extract_markdown_links(text: str) -> list[dict[str, Any]]:
+# Markdown links: [text](url)
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+_HEADING_RE_B = re.compile(rb"^#{1,6}\s+(.+)$", re.MULTILINE)
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Target checks are IO-bound (stat + read), so threads overlap them well;
+# below _PARALLEL_MIN_TARGETS the pool start-up costs more than it saves
+_MAX_WORKERS = 16
+# Targets at least this large are scanned for headings through mmap
+_MMAP_MIN_SIZE = 1 << 20
+_PARALLEL_MIN_TARGETS = 8
+# Parsed heading anchors, keyed by a digest of the document content
+_SLUG_CACHE_SIZE = 4096
+_slug_cache: dict[bytes, frozenset[str]] = {}
+
+
+class Link(NamedTuple):
+    """Internal markdown link found in a document (line is 0-indexed)."""
+
+    text: str
+    url: str
+    line: int
+
+
+def extract_markdown_links(text: str) -> list[Link]:
     """Extract internal markdown links from text.
 
     Args:
         text: Markdown content as string
 
     Returns:
-        List of dicts with keys: text, url, line
+        List of Link tuples (text, url, line)
 
     Ignores:
         - External URLs (http://, https://, mailto:)
@@ -53,16 +91,18 @@ def extract_markdown_links(text: str) -> list[dict[str, Any]]:
         if in_code_block:
             continue
 
-        # Find markdown links: [text](url)
-        for match in re.finditer(r"\[([^\]]+)\]\(([^)]+)\)", line):
-            link_text = match.group(1)
-            link_url = match.group(2)
+        # Every link contains "](", so most prose lines skip the regex
+        if "](" not in line:
+            continue
+
+        for match in _LINK_RE.finditer(line):
+            link_text, link_url = match.groups()
 
             # Skip external links
             if should_ignore_link(link_url):
                 continue
 
-            links.append({"text": link_text, "url": link_url, "line": line_num})
+            links.append(Link(link_text, link_url, line_num))
 
     return links
 
@@ -76,16 +116,7 @@ def should_ignore_link(url: str) -> bool:
     Returns:
         True if link should be ignored, False otherwise
     """
-    # External URLs
-    if url.startswith(("http://", "https://", "mailto:", "ftp://")):
-        return True
-
-    # Placeholder patterns
-    if url.startswith(("path/to/", "relative/path/to")):
-        return True
-
-    # Same-file anchors (no validation needed here)
-    return bool(url.startswith("#"))
+    return url.startswith(_IGNORED_PREFIXES)
 
 
 def resolve_link_path(source_file: Path, link: str, root: Path) -> Path:
@@ -108,7 +139,17 @@ def resolve_link_path(source_file: Path, link: str, root: Path) -> Path:
         return root / link.lstrip("/")
 
     # Relative to source file directory
-    source_dir = source_file.parent
+    return _resolve_relative(source_file.parent, link)
+
+
+@lru_cache(maxsize=16384)
+def _resolve_relative(source_dir: Path, link: str) -> Path:
+    """Resolve a link against its source directory, once per (dir, link) pair.
+
+    Path.resolve() walks the path with a syscall per component; links such
+    as ./guide.md repeat across every file in a directory. Relative source
+    paths resolve against the CWD, so it must not change between calls.
+    """
     return (source_dir / link).resolve()
 
 
@@ -121,16 +162,28 @@ def normalize_anchor(anchor: str) -> str:
     Returns:
         Normalized anchor (lowercase, hyphenated)
     """
-    # Lowercase and keep hyphens
-    normalized = anchor.lower()
+    # Lowercase, remove common special characters, replace spaces with hyphens
+    # (GitHub/most parsers generate heading anchors the same way)
+    return _WHITESPACE_RE.sub("-", _SLUG_STRIP_RE.sub("", anchor.lower()))
 
-    # Remove common special characters
-    normalized = re.sub(r"[^\w\s-]", "", normalized)
 
-    # Replace spaces with hyphens
-    normalized = re.sub(r"\s+", "-", normalized)
+def _heading_slugs(content: str) -> frozenset[str]:
+    """Parse heading anchors once per distinct document content.
 
-    return normalized
+    Keyed on a short digest of the content so the cache never keeps whole
+    documents alive; equal documents still share one parse.
+    """
+    key = hashlib.blake2b(content.encode(), digest_size=8).digest()
+    slugs = _slug_cache.get(key)
+    if slugs is None:
+        slugs = frozenset(
+            normalize_anchor(match.group(1).strip()) for match in _HEADING_RE.finditer(content)
+        )
+        # Dropping the whole cache when full is safe under the worker threads
+        if len(_slug_cache) >= _SLUG_CACHE_SIZE:
+            _slug_cache.clear()
+        _slug_cache[key] = slugs
+    return slugs
 
 
 def extract_heading_anchors(content: str) -> set[str]:
@@ -142,21 +195,7 @@ def extract_heading_anchors(content: str) -> set[str]:
     Returns:
         Set of normalized anchor strings
     """
-    anchors = set()
-
-    # Find all markdown headings (# Title, ## Subtitle, etc.)
-    for match in re.finditer(r"^#{1,6}\s+(.+)$", content, re.MULTILINE):
-        heading_text = match.group(1).strip()
-
-        # Generate anchor from heading
-        # GitHub/most parsers: lowercase, hyphens, remove special chars
-        anchor = heading_text.lower()
-        anchor = re.sub(r"[^\w\s-]", "", anchor)
-        anchor = re.sub(r"\s+", "-", anchor)
-
-        anchors.add(anchor)
-
-    return anchors
+    return set(_heading_slugs(content))
 
 
 def validate_anchor(content: str, anchor: str) -> bool:
@@ -169,56 +208,158 @@ def validate_anchor(content: str, anchor: str) -> bool:
     Returns:
         True if anchor exists, False otherwise
     """
-    valid_anchors = extract_heading_anchors(content)
-    normalized = normalize_anchor(anchor)
+    return normalize_anchor(anchor) in _heading_slugs(content)
+
+
+class LinkRef(NamedTuple):
+    """One occurrence of an internal link, tied to its resolved target."""
+
+    source: Path
+    link: Link
+    target: Path
+    anchor: str | None
+
+
+def _link_ref(source_file: Path, link: Link, root: Path) -> LinkRef:
+    """Split a link into target path and anchor, resolving the path."""
+    url = link.url
+
+    # Extract anchor if present
+    anchor = None
+    if "#" in url:
+        url_parts = url.split("#")
+        url = url_parts[0]
+        anchor = url_parts[1] or None
+
+    # Empty path means an anchor into the same file
+    target = resolve_link_path(source_file, url, root) if url else source_file
+    return LinkRef(source_file, link, target, anchor)
+
+
+def _build_file_link_map(all_links: list[LinkRef]) -> dict[Path, list[LinkRef]]:
+    """Group link occurrences by target file so each target is checked once."""
+    file_link_map: dict[Path, list[LinkRef]] = {}
+    for ref in all_links:
+        file_link_map.setdefault(ref.target, []).append(ref)
+    return file_link_map
+
+
+def _load_anchor_set(target: Path) -> frozenset[str]:
+    """Read a target file once and return its heading anchors.
+
+    Large files are mapped rather than read: the heading regex runs over the
+    raw bytes and only the matched heading text is decoded.
+    """
+    if target.stat().st_size < _MMAP_MIN_SIZE:
+        return _heading_slugs(_read_markdown(target))
+
+    with target.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return frozenset(
+            normalize_anchor(match.group(1).decode("utf-8", errors="ignore").strip())
+            for match in _HEADING_RE_B.finditer(mapped)
+        )
+
+
+def _existing_targets(targets: Iterable[Path]) -> set[Path]:
+    """Return the targets that exist, listing shared parent directories once.
+
+    Directories holding several targets are read with a single os.scandir
+    instead of one stat per target. Names missing from the listing (or lone
+    targets) are confirmed with Path.exists(), so results match it exactly,
+    including on case-insensitive filesystems.
+    """
+    by_dir: dict[Path, list[Path]] = {}
+    for target in targets:
+        by_dir.setdefault(target.parent, []).append(target)
+
+    existing: set[Path] = set()
+    for parent, siblings in by_dir.items():
+        names: set[str] = set()
+        if len(siblings) > 1:
+            try:
+                with os.scandir(parent) as entries:
+                    names = {entry.name for entry in entries if entry.is_file() or entry.is_dir()}
+            except OSError:
+                pass  # Missing parent: every sibling fails exists() below
+        existing.update(target for target in siblings if target.name in names or target.exists())
+    return existing
+
+
+def _check_target(
+    target: Path, refs: list[LinkRef], root: Path, exists: bool
+) -> list[tuple[LinkRef, str]]:
+    """Check every link pointing at one target file.
+
+    The target's existence is known up front, and its anchors are parsed at
+    most once, no matter how many links refer to it.
 
-    return normalized in valid_anchors
+    Returns:
+        (link, error message) pairs for the broken links
+    """
+    if not exists:
+        error = f"File does not exist: {target.relative_to(root)}"
+        return [(ref, error) for ref in refs]
+
+    if not any(ref.anchor for ref in refs):
+        return []
+
+    anchors = _load_anchor_set(target)
+    return [
+        (ref, f"Anchor #{ref.anchor} not found in {target.name}")
+        for ref in refs
+        if ref.anchor and normalize_anchor(ref.anchor) not in anchors
+    ]
 
 
-def validate_link(source_file: Path, link: dict[str, Any], root: Path) -> dict[str, Any]:
+def validate_link(source_file: Path, link: Link, root: Path) -> dict[str, Any]:
     """Validate a single markdown link.
 
     Args:
         source_file: File containing the link
-        link: Link dict with keys: text, url, line
+        link: Link to validate
         root: Project root directory
 
     Returns:
         Dict with keys: valid (bool), error (str or None)
     """
-    url = link["url"]
+    ref = _link_ref(source_file, link, root)
+    for _, error in _check_target(ref.target, [ref], root, ref.target.exists()):
+        return {"valid": False, "error": error}
+    return {"valid": True, "error": None}
 
-    # Extract anchor if present
-    anchor = None
-    if "#" in url:
-        url_parts = url.split("#")
-        url = url_parts[0]
-        anchor = url_parts[1] if len(url_parts) > 1 else None
-
-    # Resolve file path
-    if url:  # Not just an anchor
-        resolved_path = resolve_link_path(source_file, url, root)
-
-        # Check if file exists
-        if not resolved_path.exists():
-            return {
-                "valid": False,
-                "error": f"File does not exist: {resolved_path.relative_to(root)}",
-            }
-    else:
-        # Just an anchor (same file)
-        resolved_path = source_file
-
-    # Validate anchor if present
-    if anchor:
-        content = resolved_path.read_text(encoding="utf-8", errors="ignore")
-        if not validate_anchor(content, anchor):
-            return {
-                "valid": False,
-                "error": f"Anchor #{anchor} not found in {resolved_path.name}",
-            }
 
-    return {"valid": True, "error": None}
+def _read_markdown(path: Path) -> str:
+    """Read a markdown file in one bulk read, decoding undecodable bytes away."""
+    text = path.read_bytes().decode("utf-8", errors="ignore")
+    # Match read_text's universal newlines so line numbers stay the same
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _iter_markdown(directory: Path) -> Iterator[Path]:
+    """Yield markdown files under directory using os.scandir.
+
+    DirEntry caches the type from the directory listing, so no extra stat
+    call is needed per entry. Symlinked directories are not followed. Like
+    Path.rglob, a missing directory yields nothing and unreadable
+    subdirectories are skipped.
+    """
+    if not directory.is_dir():
+        return
+
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    yield Path(entry.path)
 
 
 def scan_markdown_files(directory: Path) -> list[Path]:
@@ -230,7 +371,57 @@ def scan_markdown_files(directory: Path) -> list[Path]:
     Returns:
         List of markdown file paths
     """
-    return sorted(directory.rglob("*.md"))
+    return sorted(_iter_markdown(directory))
+
+
+def validate_files(files: list[Path], root: Path) -> list[dict[str, Any]]:
+    """Validate the internal links of the given markdown files.
+
+    Links are grouped by target file first, so each target is stat-ed and
+    parsed once however many links refer to it. Larger sets of targets are
+    checked concurrently on a thread pool.
+
+    Args:
+        files: Markdown files to validate
+        root: Project root directory
+
+    Returns:
+        List of error dicts with keys: file, line, link, error (in file and
+        line order)
+    """
+    all_links: list[LinkRef] = []
+    for file_path in files:
+        content = _read_markdown(file_path)
+        all_links.extend(
+            _link_ref(file_path, link, root) for link in extract_markdown_links(content)
+        )
+
+    file_link_map = _build_file_link_map(all_links)
+    existing = _existing_targets(file_link_map)
+    exists = [target in existing for target in file_link_map]
+    if len(file_link_map) < _PARALLEL_MIN_TARGETS:
+        results = list(
+            map(_check_target, file_link_map, file_link_map.values(), repeat(root), exists)
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+            results = list(
+                pool.map(_check_target, file_link_map, file_link_map.values(), repeat(root), exists)
+            )
+
+    order = {id(ref): index for index, ref in enumerate(all_links)}
+    broken = [pair for result in results for pair in result]
+    broken.sort(key=lambda pair: order[id(pair[0])])
+
+    return [
+        {
+            "file": str(ref.source.relative_to(root)),
+            "line": ref.link.line + 1,  # 1-indexed for humans
+            "link": ref.link.url,
+            "error": error,
+        }
+        for ref, error in broken
+    ]
 
 
 def validate_directory(
@@ -249,31 +440,12 @@ def validate_directory(
     if exclude_patterns is None:
         exclude_patterns = []
 
-    errors = []
-    markdown_files = scan_markdown_files(directory)
-
-    for file_path in markdown_files:
-        # Check exclusion patterns
-        if any(pattern in str(file_path) for pattern in exclude_patterns):
-            continue
-
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
-        links = extract_markdown_links(content)
-
-        for link in links:
-            result = validate_link(file_path, link, root)
-
-            if not result["valid"]:
-                errors.append(
-                    {
-                        "file": str(file_path.relative_to(root)),
-                        "line": link["line"] + 1,  # 1-indexed for humans
-                        "link": link["url"],
-                        "error": result["error"],
-                    }
-                )
-
-    return errors
+    markdown_files = [
+        file_path
+        for file_path in scan_markdown_files(directory)
+        if not any(pattern in str(file_path) for pattern in exclude_patterns)
+    ]
+    return validate_files(markdown_files, root)
 
 
 def generate_report(errors: list[dict[str, Any]]) -> str:
@@ -333,23 +505,7 @@ def main() -> int:
     all_errors.extend(errors)
 
     # Validate root files
-    for root_file in root_files:
-        if root_file.exists():
-            content = root_file.read_text(encoding="utf-8", errors="ignore")
-            links = extract_markdown_links(content)
-
-            for link in links:
-                result = validate_link(root_file, link, ROOT)
-
-                if not result["valid"]:
-                    all_errors.append(
-                        {
-                            "file": str(root_file.relative_to(ROOT)),
-                            "line": link["line"] + 1,
-                            "link": link["url"],
-                            "error": result["error"],
-                        }
-                    )
+    all_errors.extend(validate_files([f for f in root_files if f.exists()], ROOT))
 
     # Generate report
     report = generate_report(all_errors)
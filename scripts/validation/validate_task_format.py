@@ -81,6 +81,17 @@ class TaskFormatValidator:
         "test",
     }
 
+    # Execution phrasing that /plan should not be used for
+    _PLAN_EXECUTION_KEYWORDS = ("write", "implement", "create code")
+
+    # Task number with optional indentation: "1.", "  1.2.3."
+    _NUMBER_RE = re.compile(r"^\s*(\d+(?:\.\d+)*)\.")
+    # Full format: <number>. /<workflow> - <description> (hierarchical numbers allowed)
+    _PREFIX_RE = re.compile(r"^\s*(\d+(?:\.\d+)*)\.\s+(/[a-z-]+)\s+-\s+.+")
+    _DESCRIPTION_RE = re.compile(r"^\s*\d+(?:\.\d+)*\.\s+(.+)")
+    _WORKFLOW_RE = re.compile(r"/([a-z-]+)")
+    _WORKFLOW_DESCRIPTION_RE = re.compile(r"/[a-z-]+\s+-\s+(.+)")
+
     def __init__(self) -> None:
         """Initialize validator."""
         self.results: list[ValidationResult] = []
@@ -89,25 +100,49 @@ class TaskFormatValidator:
         """
         Validate a single task update/plan.
 
+        All checks share one pass over the plan: each step's task number is
+        parsed once and feeds the prefix, in-progress and numbering checks.
+
         Args:
             plan: List of task dicts with 'step' and 'status' keys
 
         Returns:
             List of ValidationResult objects
         """
-        self.results = []
+        prefix_results: list[ValidationResult] = []
+        attribution_results: list[ValidationResult] = []
+        task_numbers: list[str] = []
+        in_progress_numbers: list[str] = []
+        in_progress_count = 0
+
+        for task in plan:
+            step = task.get("step", "")
+            number_match = self._NUMBER_RE.match(step)
+            number = number_match.group(1) if number_match else None
 
-        # Check 1: Workflow prefix presence
-        self._check_workflow_prefix(plan)
+            # Check 1: Workflow prefix presence
+            prefix_result = self._check_workflow_prefix(step, number)
+            if prefix_result:
+                prefix_results.append(prefix_result)
 
-        # Check 2: Correct attribution
-        self._check_workflow_attribution(plan)
+            # Check 2: Correct attribution
+            attribution_results.extend(self._check_workflow_attribution(step))
+
+            if number is not None:
+                task_numbers.append(number)
+            if task.get("status") == "in_progress":
+                in_progress_count += 1
+                if number is not None:
+                    in_progress_numbers.append(number)
+
+        self.results = prefix_results + attribution_results
 
         # Check 3: Single in_progress task
-        self._check_single_in_progress(plan)
+        if in_progress_count > 1:
+            self._check_single_in_progress(in_progress_numbers)
 
         # Check 4: Valid numbering
-        self._check_valid_numbering(plan)
+        self._check_valid_numbering(task_numbers)
 
         return self.results
 
@@ -122,160 +157,131 @@ class TaskFormatValidator:
             current_plan: Current task plan
 
         Returns:
-            List of ValidationResult objects
+            List of ValidationResult objects, in previous-plan order
         """
-        self.results = []
-
-        # Extract completed tasks from previous plan
-        previous_completed = {
-            task["step"] for task in previous_plan if task.get("status") == "completed"
-        }
-
-        # Extract all tasks from current plan
         current_all = {task["step"] for task in current_plan}
 
-        # Check for removed completed tasks
-        removed_completed = previous_completed - current_all
-
-        for removed_task in removed_completed:
-            self.results.append(
-                ValidationResult(
-                    check_name="Completed Task Preservation",
-                    severity="critical",
-                    passed=False,
-                    message=f"Removed completed task: '{removed_task}'. "
-                    f"Completed tasks must be preserved in task history.",
-                    task_step=removed_task,
-                )
+        # Completed tasks from the previous plan missing from the current one
+        # (dict.fromkeys drops repeats but keeps plan order)
+        removed_completed = dict.fromkeys(
+            task["step"]
+            for task in previous_plan
+            if task.get("status") == "completed" and task["step"] not in current_all
+        )
+
+        self.results = [
+            ValidationResult(
+                check_name="Completed Task Preservation",
+                severity="critical",
+                passed=False,
+                message=f"Removed completed task: '{removed_task}'. "
+                f"Completed tasks must be preserved in task history.",
+                task_step=removed_task,
             )
+            for removed_task in removed_completed
+        ]
 
         return self.results
 
-    def _check_workflow_prefix(self, plan: list[dict[str, str]]) -> None:
-        """Check that every task has /<workflow> prefix."""
-        # Pattern: <number>. /<workflow> - <description>
-        # Allow hierarchical: 1.1.1. /<workflow> - ...
-        workflow_pattern = re.compile(r"^\s*(\d+(?:\.\d+)*)\.\s+(/[a-z-]+)\s+-\s+.+")
-
-        for task in plan:
-            step = task.get("step", "")
-
-            # Extract task number (with indentation)
-            number_match = re.match(r"^\s*(\d+(?:\.\d+)*)\.", step)
-            if not number_match:
-                # No number found - might be malformed
-                self.results.append(
-                    ValidationResult(
-                        check_name="Task Format",
-                        severity="critical",
-                        passed=False,
-                        message=f"Task '{step}' is malformed (no task number found). "
-                        f"Expected format: '<number>. /<workflow> - <description>'",
-                        task_step=step,
-                    )
-                )
-                continue
-
-            # Check for workflow prefix
-            if not workflow_pattern.match(step):
-                # Missing workflow prefix
-                task_number = number_match.group(1)
-                # Try to extract description after number
-                desc_match = re.match(r"^\s*\d+(?:\.\d+)*\.\s+(.+)", step)
-                description = desc_match.group(1) if desc_match else "task"
-
-                self.results.append(
-                    ValidationResult(
-                        check_name="Workflow Prefix",
-                        severity="critical",
-                        passed=False,
-                        message=f"Task '{step}' missing workflow prefix. "
-                        f"Expected format: '{task_number}. /<workflow> - {description}'. "
-                        f"Example: '{task_number}. /implement - {description}'",
-                        task_step=step,
-                    )
-                )
-
-    def _check_workflow_attribution(self, plan: list[dict[str, str]]) -> None:
-        """Check that workflows are correctly attributed (executor vs orchestrator)."""
-        for task in plan:
-            step = task.get("step", "")
-
-            # Extract workflow name
-            workflow_match = re.search(r"/([a-z-]+)", step)
-            if not workflow_match:
-                continue  # Already flagged by prefix check
-
-            workflow = f"/{workflow_match.group(1)}"
-
-            # Extract description (after workflow prefix)
-            desc_match = re.search(r"/[a-z-]+\s+-\s+(.+)", step)
-            description = desc_match.group(1).lower() if desc_match else ""
+    def _check_workflow_prefix(self, step: str, number: str | None) -> ValidationResult | None:
+        """Check that a task has a /<workflow> prefix."""
+        if number is None:
+            # No number found - might be malformed
+            return ValidationResult(
+                check_name="Task Format",
+                severity="critical",
+                passed=False,
+                message=f"Task '{step}' is malformed (no task number found). "
+                f"Expected format: '<number>. /<workflow> - <description>'",
+                task_step=step,
+            )
 
-            # Check if orchestrator is being used for execution work
-            if workflow in self.ORCHESTRATOR_WORKFLOWS:
-                # Check for execution keywords
-                has_execution_keyword = any(
-                    keyword in description for keyword in self.EXECUTION_KEYWORDS
+        if self._PREFIX_RE.match(step):
+            return None
+
+        # Missing workflow prefix; try to extract description after number
+        desc_match = self._DESCRIPTION_RE.match(step)
+        description = desc_match.group(1) if desc_match else "task"
+
+        return ValidationResult(
+            check_name="Workflow Prefix",
+            severity="critical",
+            passed=False,
+            message=f"Task '{step}' missing workflow prefix. "
+            f"Expected format: '{number}. /<workflow> - {description}'. "
+            f"Example: '{number}. /implement - {description}'",
+            task_step=step,
+        )
+
+    def _check_workflow_attribution(self, step: str) -> list[ValidationResult]:
+        """Check that a task's workflow is correctly attributed (executor vs orchestrator)."""
+        # Extract workflow name
+        workflow_match = self._WORKFLOW_RE.search(step)
+        if not workflow_match:
+            return []  # Already flagged by prefix check
+
+        workflow = f"/{workflow_match.group(1)}"
+
+        # Extract description (after workflow prefix)
+        desc_match = self._WORKFLOW_DESCRIPTION_RE.search(step)
+        description = desc_match.group(1).lower() if desc_match else ""
+
+        results = []
+
+        # Check if orchestrator is being used for execution work
+        if workflow in self.ORCHESTRATOR_WORKFLOWS and any(
+            keyword in description for keyword in self.EXECUTION_KEYWORDS
+        ):
+            # Suggest correct workflow
+            suggested = "/implement"
+            results.append(
+                ValidationResult(
+                    check_name="Workflow Attribution",
+                    severity="warning",
+                    passed=False,
+                    message=f"Task '{step}' uses orchestrator {workflow} for execution work. "
+                    f"Execution tasks should use {suggested} or other executor workflows. "
+                    f"Orchestrators coordinate, executors perform work.",
+                    task_step=step,
                 )
+            )
 
-                if has_execution_keyword:
-                    # Suggest correct workflow
-                    suggested = "/implement"
-                    self.results.append(
-                        ValidationResult(
-                            check_name="Workflow Attribution",
-                            severity="warning",
-                            passed=False,
-                            message=f"Task '{step}' uses orchestrator {workflow} for execution work. "
-                            f"Execution tasks should use {suggested} or other executor workflows. "
-                            f"Orchestrators coordinate, executors perform work.",
-                            task_step=step,
-                        )
-                    )
-
-            # Check for specific anti-patterns
-            if workflow == "/work" and "session end protocol" in description:
-                self.results.append(
-                    ValidationResult(
-                        check_name="Workflow Attribution",
-                        severity="warning",
-                        passed=False,
-                        message=f"Task '{step}' should use /work-session-protocol instead of /work. "
-                        f"Use sub-workflow for session end protocol.",
-                        task_step=step,
-                    )
+        # Check for specific anti-patterns
+        if workflow == "/work" and "session end protocol" in description:
+            results.append(
+                ValidationResult(
+                    check_name="Workflow Attribution",
+                    severity="warning",
+                    passed=False,
+                    message=f"Task '{step}' should use /work-session-protocol instead of /work. "
+                    f"Use sub-workflow for session end protocol.",
+                    task_step=step,
                 )
+            )
 
-            if workflow == "/plan" and any(
-                keyword in description for keyword in ["write", "implement", "create code"]
-            ):
-                self.results.append(
-                    ValidationResult(
-                        check_name="Workflow Attribution",
-                        severity="warning",
-                        passed=False,
-                        message=f"Task '{step}' uses /plan for execution work. "
-                        f"/plan is for planning, use /implement for code changes.",
-                        task_step=step,
-                    )
+        if workflow == "/plan" and any(
+            keyword in description for keyword in self._PLAN_EXECUTION_KEYWORDS
+        ):
+            results.append(
+                ValidationResult(
+                    check_name="Workflow Attribution",
+                    severity="warning",
+                    passed=False,
+                    message=f"Task '{step}' uses /plan for execution work. "
+                    f"/plan is for planning, use /implement for code changes.",
+                    task_step=step,
                 )
+            )
 
-    def _check_single_in_progress(self, plan: list[dict[str, str]]) -> None:
-        """Check that only one task is in_progress at a time (excluding parent-child chains)."""
-        in_progress_tasks = [task for task in plan if task.get("status") == "in_progress"]
-
-        if len(in_progress_tasks) <= 1:
-            return
+        return results
 
-        # Extract task numbers to check for parent-child relationships
-        task_numbers = []
-        for task in in_progress_tasks:
-            step = task["step"]
-            number_match = re.match(r"^\s*(\d+(?:\.\d+)*)\.", step)
-            if number_match:
-                task_numbers.append(number_match.group(1))
+    def _check_single_in_progress(self, task_numbers: list[str]) -> None:
+        """Check that multiple in_progress tasks form a parent-child chain.
 
+        Args:
+            task_numbers: Numbers of the in_progress tasks (called only when
+                more than one task is in_progress)
+        """
         # Check if all in_progress tasks form a parent-child chain
         # Valid examples: ["1", "1.1"], ["1", "1.1", "1.1.2"], ["2.3", "2.3.1"]
         # Invalid: ["1", "2"], ["1.1", "1.2"]
@@ -305,16 +311,8 @@ class TaskFormatValidator:
                 )
             )
 
-    def _check_valid_numbering(self, plan: list[dict[str, str]]) -> None:
+    def _check_valid_numbering(self, task_numbers: list[str]) -> None:
         """Check that task numbering is sequential and valid."""
-        # Extract numbers from tasks
-        task_numbers = []
-        for task in plan:
-            step = task.get("step", "")
-            number_match = re.match(r"^\s*(\d+(?:\.\d+)*)\.", step)
-            if number_match:
-                task_numbers.append(number_match.group(1))
-
         # Group by depth (number of dots)
         by_depth: dict[int, list[str]] = {}
         for number_str in task_numbers:
@@ -394,20 +394,19 @@ class CacheKeyBuilder:
         """Build cache key for summary based on content hash.
 
         Args:
-            content_hash: SHA-256 hash of content being summarized
+            content_hash: Hash of content being summarized
             query: Optional query string
             model: LLM model name to avoid cross-model collisions
 
         Returns:
-            Cache key string
+            Cache key string of the form ``summary:<32 hex chars>``
 
         Note:
             Uses content hash instead of URL to cache identical content
-            from different sources (deduplication).
+            from different sources (deduplication). Fields are joined with
+            a unit separator and digested with BLAKE2b, so the key stays
+            short however long the query is.
         """
-        parts = ["summary", content_hash]
-        if query:
-            parts.append(f"query={query}")
-        if model:
-            parts.append(f"model={model}")
-        return ":".join(parts)
+        payload = "\x1f".join((content_hash, query or "", model or ""))
+        digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return f"summary:{digest}"
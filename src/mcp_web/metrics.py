@@ -11,12 +11,17 @@ Design Decision DD-018: Structured logging for observability.
 """
 
 import json
+import logging
+import sys
 import time
+from array import array
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -91,6 +96,59 @@ class CacheMetrics:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
+class _Counter(IntEnum):
+    """Counters with names fixed at definition time, stored in an array slot."""
+
+    FETCH_ERRORS = 0
+    EXTRACTIONS = 1
+    EXTRACTION_ERRORS = 2
+    CHUNKING_OPERATIONS = 3
+    CHUNKING_ADAPTIVE_ENABLED = 4
+    SUMMARIZATIONS = 5
+    SUMMARIZATION_ERRORS = 6
+    TOTAL_INPUT_TOKENS = 7
+    TOTAL_OUTPUT_TOKENS = 8
+    CACHE_HIT = 9
+    CACHE_MISS = 10
+    CACHE_SET = 11
+    CACHE_EVICT = 12
+    CACHE_DELETE = 13
+
+
+_COUNTER_NAMES = tuple(counter.name.lower() for counter in _Counter)
+_CACHE_COUNTERS = {
+    "hit": _Counter.CACHE_HIT,
+    "miss": _Counter.CACHE_MISS,
+    "set": _Counter.CACHE_SET,
+    "evict": _Counter.CACHE_EVICT,
+    "delete": _Counter.CACHE_DELETE,
+}
+
+
+def _zeroed_counters() -> "array[int]":
+    return array("Q", bytes(8 * len(_Counter)))
+
+
+# Per-token (input, output) USD rates; unknown models fall back to GPT-4o-mini
+# pricing, matching the original flat estimate.
+_MODEL_RATES: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (1.5e-7, 6.0e-7),
+    "gpt-4o": (2.5e-6, 1.0e-5),
+    "gpt-4": (3.0e-5, 6.0e-5),
+}
+_DEFAULT_RATES = _MODEL_RATES["gpt-4o-mini"]
+
+
+def _copy_export(metrics: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached export so callers cannot modify the cache through it."""
+    return {
+        "summary": dict(metrics["summary"]),
+        "counters": dict(metrics["counters"]),
+        "avg_durations_ms": dict(metrics["avg_durations_ms"]),
+        "errors": [dict(error) for error in metrics["errors"]],
+    }
+
+
 class MetricsCollector:
     """Centralized metrics collection.
 
@@ -117,10 +175,52 @@ class MetricsCollector:
         self.summarization_metrics: list[SummarizationMetrics] = []
         self.cache_metrics: list[CacheMetrics] = []
 
-        # Aggregated counters
-        self.counters: dict[str, int] = defaultdict(int)
-        self.timers: dict[str, list[float]] = defaultdict(list)
-        self.errors: list[dict[str, Any]] = []
+        # Aggregated counters: fixed names in an array, per-method/strategy/
+        # module names in a dict. Read both through ``counters``.
+        self._fixed_counters = _zeroed_counters()
+        self._dynamic_counters: dict[str, int] = defaultdict(int)
+        # Running (total_ms, count) per timer; only the mean is exported
+        self.timers: dict[str, tuple[float, int]] = {}
+        # Errors as parallel columns; ``errors`` rebuilds the per-error dicts
+        self._err_modules: list[str] = []
+        self._err_types: list[str] = []
+        self._err_msgs: list[str] = []
+        self._err_ctx: list[dict[str, Any]] = []
+        self._err_times: list[str] = []
+
+        # Composed per-method/per-module keys, interned once and reused.
+        # Not metric state: survives reset() and is shared with copies.
+        self._fetch_keys: dict[str, tuple[str, str]] = {}
+        self._error_keys: dict[str, str] = {}
+
+        # Bumped on every mutation; export_metrics() reuses its last result
+        # while the generation is unchanged.
+        self._generation = 0
+        self._export_cache: tuple[dict[str, Any] | None, int] = (None, -1)
+
+    def __copy__(self) -> "MetricsCollector":
+        """Copy collector with independent metric storage.
+
+        Configuration is shared; recorded metrics are copied so the clone can
+        be mutated without affecting the original.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.fetch_metrics = list(self.fetch_metrics)
+        clone.extraction_metrics = list(self.extraction_metrics)
+        clone.chunking_metrics = list(self.chunking_metrics)
+        clone.summarization_metrics = list(self.summarization_metrics)
+        clone.cache_metrics = list(self.cache_metrics)
+        clone._fixed_counters = array("Q", self._fixed_counters)
+        clone._dynamic_counters = defaultdict(int, self._dynamic_counters)
+        clone.timers = dict(self.timers)
+        clone._err_modules = list(self._err_modules)
+        clone._err_types = list(self._err_types)
+        clone._err_msgs = list(self._err_msgs)
+        clone._err_ctx = list(self._err_ctx)
+        clone._err_times = list(self._err_times)
+        clone._export_cache = (None, -1)
+        return clone
 
     def record_fetch(
         self,
@@ -135,6 +235,7 @@ class MetricsCollector:
         """Record fetch metrics."""
         if not self.enabled:
             return
+        self._generation += 1
 
         metric = FetchMetrics(
             url=url,
@@ -146,11 +247,18 @@ class MetricsCollector:
             error=error,
         )
         self.fetch_metrics.append(metric)
-        self.counters[f"fetch_{method}"] += 1
-        self.timers[f"fetch_{method}_duration"].append(duration_ms)
+        keys = self._fetch_keys.get(method)
+        if keys is None:
+            keys = self._fetch_keys[method] = (
+                sys.intern(f"fetch_{method}"),
+                sys.intern(f"fetch_{method}_duration"),
+            )
+        counter_key, timer_key = keys
+        self._dynamic_counters[counter_key] += 1
+        self._add_timer(timer_key, duration_ms)
 
         if not success:
-            self.counters["fetch_errors"] += 1
+            self._fixed_counters[_Counter.FETCH_ERRORS] += 1
 
         logger.info(
             "fetch_completed",
@@ -172,6 +280,7 @@ class MetricsCollector:
         """Record extraction metrics."""
         if not self.enabled:
             return
+        self._generation += 1
 
         ratio = extracted_length / content_length if content_length > 0 else 0.0
         metric = ExtractionMetrics(
@@ -184,11 +293,11 @@ class MetricsCollector:
             error=error,
         )
         self.extraction_metrics.append(metric)
-        self.counters["extractions"] += 1
-        self.timers["extraction_duration"].append(duration_ms)
+        self._fixed_counters[_Counter.EXTRACTIONS] += 1
+        self._add_timer("extraction_duration", duration_ms)
 
         if not success:
-            self.counters["extraction_errors"] += 1
+            self._fixed_counters[_Counter.EXTRACTION_ERRORS] += 1
 
         logger.info(
             "extraction_completed",
@@ -212,6 +321,7 @@ class MetricsCollector:
         """Record chunking metrics."""
         if not self.enabled:
             return
+        self._generation += 1
 
         metric = ChunkingMetrics(
             content_length=content_length,
@@ -223,11 +333,11 @@ class MetricsCollector:
             target_chunk_size=target_chunk_size,
         )
         self.chunking_metrics.append(metric)
-        self.counters["chunking_operations"] += 1
-        self.timers["chunking_duration"].append(duration_ms)
-        self.counters[f"chunking_strategy_{strategy}"] += 1
+        self._fixed_counters[_Counter.CHUNKING_OPERATIONS] += 1
+        self._add_timer("chunking_duration", duration_ms)
+        self._dynamic_counters[f"chunking_strategy_{strategy}"] += 1
         if adaptive_enabled:
-            self.counters["chunking_adaptive_enabled"] += 1
+            self._fixed_counters[_Counter.CHUNKING_ADAPTIVE_ENABLED] += 1
 
         logger.info(
             "chunking_completed",
@@ -251,9 +361,11 @@ class MetricsCollector:
         """Record summarization metrics."""
         if not self.enabled:
             return
+        self._generation += 1
 
-        # Rough cost estimation (GPT-4o-mini pricing as of 2025)
-        cost_estimate = (input_tokens * 0.00015 / 1000) + (output_tokens * 0.0006 / 1000)
+        # Rough cost estimation (list pricing as of 2025)
+        in_rate, out_rate = _MODEL_RATES.get(model, _DEFAULT_RATES)
+        cost_estimate = input_tokens * in_rate + output_tokens * out_rate
 
         metric = SummarizationMetrics(
             input_tokens=input_tokens,
@@ -265,13 +377,14 @@ class MetricsCollector:
             error=error,
         )
         self.summarization_metrics.append(metric)
-        self.counters["summarizations"] += 1
-        self.counters["total_input_tokens"] += input_tokens
-        self.counters["total_output_tokens"] += output_tokens
-        self.timers["summarization_duration"].append(duration_ms)
+        fixed = self._fixed_counters
+        fixed[_Counter.SUMMARIZATIONS] += 1
+        fixed[_Counter.TOTAL_INPUT_TOKENS] += input_tokens
+        fixed[_Counter.TOTAL_OUTPUT_TOKENS] += output_tokens
+        self._add_timer("summarization_duration", duration_ms)
 
         if not success:
-            self.counters["summarization_errors"] += 1
+            fixed[_Counter.SUMMARIZATION_ERRORS] += 1
 
         logger.info(
             "summarization_completed",
@@ -291,6 +404,7 @@ class MetricsCollector:
         """Record cache operation."""
         if not self.enabled:
             return
+        self._generation += 1
 
         metric = CacheMetrics(
             operation=operation,
@@ -298,7 +412,11 @@ class MetricsCollector:
             size_bytes=size_bytes,
         )
         self.cache_metrics.append(metric)
-        self.counters[f"cache_{operation}"] += 1
+        counter = _CACHE_COUNTERS.get(operation)
+        if counter is not None:
+            self._fixed_counters[counter] += 1
+        else:
+            self._dynamic_counters[f"cache_{operation}"] += 1
 
         logger.debug("cache_operation", operation=operation, key=key[:50])
 
@@ -308,24 +426,94 @@ class MetricsCollector:
         """Record error for diagnostics."""
         if not self.enabled:
             return
-
-        error_data = {
-            "module": module,
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            "context": context or {},
-            "timestamp": datetime.now().isoformat(),
-        }
-        self.errors.append(error_data)
-        self.counters[f"error_{module}"] += 1
+        self._generation += 1
+
+        error_type = type(error).__name__
+        error_message = str(error)
+        self._err_modules.append(module)
+        self._err_types.append(error_type)
+        self._err_msgs.append(error_message)
+        self._err_ctx.append(context or {})
+        self._err_times.append(datetime.now().isoformat())
+        key = self._error_keys.get(module)
+        if key is None:
+            key = self._error_keys[module] = sys.intern(f"error_{module}")
+        self._dynamic_counters[key] += 1
 
         logger.error(
             "error_recorded",
             module=module,
-            error_type=type(error).__name__,
-            error_message=str(error),
+            error_type=error_type,
+            error_message=error_message,
         )
 
+    @property
+    def errors(self) -> list[dict[str, Any]]:
+        """Recorded errors as one dict per error, oldest first."""
+        return [
+            {
+                "module": module,
+                "error_type": error_type,
+                "error_message": message,
+                "context": context,
+                "timestamp": timestamp,
+            }
+            for module, error_type, message, context, timestamp in zip(
+                self._err_modules,
+                self._err_types,
+                self._err_msgs,
+                self._err_ctx,
+                self._err_times,
+                strict=True,
+            )
+        ]
+
+    def record_batch(self, events: list[tuple[str, dict[str, Any]]]) -> None:
+        """Record several metrics in one call.
+
+        Args:
+            events: ``(kind, kwargs)`` pairs, where kind is one of ``fetch``,
+                ``extraction``, ``chunking``, ``summarization``, ``cache_operation``
+                or ``error`` and kwargs are passed to the matching ``record_*``
+
+        Raises:
+            ValueError: If an event kind is unknown
+        """
+        if not self.enabled:
+            return
+
+        recorders: dict[str, Callable[..., None]] = {
+            "fetch": self.record_fetch,
+            "extraction": self.record_extraction,
+            "chunking": self.record_chunking,
+            "summarization": self.record_summarization,
+            "cache_operation": self.record_cache_operation,
+            "error": self.record_error,
+        }
+        for kind, kwargs in events:
+            recorder = recorders.get(kind)
+            if recorder is None:
+                raise ValueError(f"Unknown metric kind: {kind}")
+            recorder(**kwargs)
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Snapshot of all counters; fixed counters are included once non-zero.
+
+        Missing names read as 0. Mutating the snapshot does not affect the
+        collector.
+        """
+        counters: dict[str, int] = defaultdict(int, self._dynamic_counters)
+        for name, value in zip(_COUNTER_NAMES, self._fixed_counters, strict=True):
+            if value:
+                counters[name] = value
+        return counters
+
+    def _add_timer(self, name: str, duration_ms: float) -> None:
+        """Accumulate a duration sample into the running total for a timer."""
+        total, count = self.timers.get(name, (0.0, 0))
+        self.timers[name] = (total + duration_ms, count + 1)
+
     @contextmanager
     def timer(self, operation: str) -> Iterator[None]:
         """Context manager for timing operations.
@@ -340,33 +528,41 @@ class MetricsCollector:
             yield
         finally:
             duration_ms = (time.perf_counter() - start) * 1000
-            self.timers[operation].append(duration_ms)
+            self._add_timer(operation, duration_ms)
+            self._generation += 1
 
     def export_metrics(self) -> dict[str, Any]:
         """Export all metrics as dict.
 
+        The aggregation is cached until the next ``record_*``, ``timer`` or
+        ``reset`` call; each call returns its own copy, safe to modify.
+
         Returns:
             Dictionary with aggregated metrics
         """
+        cached, generation = self._export_cache
+        if cached is not None and generation == self._generation:
+            return _copy_export(cached)
+
         # Calculate aggregated statistics
         avg_durations = {
-            key: sum(vals) / len(vals) if vals else 0.0 for key, vals in self.timers.items()
+            key: total / count if count else 0.0 for key, (total, count) in self.timers.items()
         }
 
         cache_hit_rate = 0.0
-        cache_hits = self.counters.get("cache_hit", 0)
-        cache_misses = self.counters.get("cache_miss", 0)
+        cache_hits = self._fixed_counters[_Counter.CACHE_HIT]
+        cache_misses = self._fixed_counters[_Counter.CACHE_MISS]
         if cache_hits + cache_misses > 0:
             cache_hit_rate = cache_hits / (cache_hits + cache_misses)
 
         total_cost = sum(m.cost_estimate for m in self.summarization_metrics)
 
-        return {
+        metrics = {
             "summary": {
                 "total_fetches": len(self.fetch_metrics),
                 "total_extractions": len(self.extraction_metrics),
                 "total_summarizations": len(self.summarization_metrics),
-                "total_errors": len(self.errors),
+                "total_errors": len(self._err_modules),
                 "cache_hit_rate": cache_hit_rate,
                 "total_cost_usd": round(total_cost, 4),
             },
@@ -374,6 +570,8 @@ class MetricsCollector:
             "avg_durations_ms": avg_durations,
             "errors": self.errors,
         }
+        self._export_cache = (metrics, self._generation)
+        return _copy_export(metrics)
 
     def save_metrics(self, path: Path | None = None) -> None:
         """Save metrics to JSON file.
@@ -389,8 +587,7 @@ class MetricsCollector:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(metrics, f, indent=2)
+        output_path.write_text(json.dumps(metrics, indent=2))
 
         logger.info("metrics_exported", path=str(output_path))
 
@@ -401,9 +598,15 @@ class MetricsCollector:
         self.chunking_metrics.clear()
         self.summarization_metrics.clear()
         self.cache_metrics.clear()
-        self.counters.clear()
+        self._fixed_counters = _zeroed_counters()
+        self._dynamic_counters.clear()
         self.timers.clear()
-        self.errors.clear()
+        self._err_modules.clear()
+        self._err_types.clear()
+        self._err_msgs.clear()
+        self._err_ctx.clear()
+        self._err_times.clear()
+        self._generation += 1
 
 
 # Global metrics collector instance
@@ -422,13 +625,15 @@ def get_metrics_collector() -> MetricsCollector:
     return _global_collector
 
 
-def configure_logging(level: str = "INFO", structured: bool = True) -> None:
-    """Configure structlog logging.
+def reset_global_collector() -> None:
+    """Drop the global collector so the next get_metrics_collector() creates one."""
+    global _global_collector
+    _global_collector = None
 
-    Args:
-        level: Log level (DEBUG, INFO, WARNING, ERROR)
-        structured: Use structured JSON output
-    """
+
+@lru_cache(maxsize=8)
+def _logging_config(level: str, structured: bool) -> dict[str, Any]:
+    """Build the structlog configuration for a (level, structured) pair once."""
     processors: list[structlog.types.Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
@@ -440,12 +645,28 @@ def configure_logging(level: str = "INFO", structured: bool = True) -> None:
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
-    structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(structlog.stdlib, level.upper(), structlog.INFO)
+    return {
+        "processors": processors,
+        "wrapper_class": structlog.make_filtering_bound_logger(
+            getattr(logging, level, logging.INFO)
         ),
-        context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
+        "context_class": dict,
+        "logger_factory": structlog.PrintLoggerFactory(),
+        "cache_logger_on_first_use": True,
+    }
+
+
+def configure_logging(level: str = "INFO", structured: bool = True) -> None:
+    """Configure structlog logging.
+
+    Repeated calls with the same arguments are no-ops while the configuration
+    they applied is still active.
+
+    Args:
+        level: Log level (DEBUG, INFO, WARNING, ERROR)
+        structured: Use structured JSON output
+    """
+    config = _logging_config(level.upper(), structured)
+    if structlog.is_configured() and structlog.get_config()["processors"] is config["processors"]:
+        return
+    structlog.configure(**config)
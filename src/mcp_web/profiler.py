@@ -22,8 +22,9 @@ import json
 import pstats
 import time
 from collections import defaultdict
-from collections.abc import AsyncIterator, Callable, Iterator
-from contextlib import asynccontextmanager, contextmanager
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import asdict, dataclass, field
 from io import StringIO
 from pathlib import Path
@@ -33,6 +34,9 @@ import structlog
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# When False, @profile-decorated functions call straight through without timing
+_PROFILE_ENABLED: ContextVar[bool] = ContextVar("_PROFILE_ENABLED", default=True)
+
 logger: structlog.stdlib.BoundLogger | None = None
 
 
@@ -80,6 +84,8 @@ class ProfilerContext:
         >>> print(f"Query took {ctx.duration_ms:.2f}ms")
     """
 
+    __slots__ = ("name", "metadata", "start_time", "end_time", "duration_ms", "success", "error")
+
     def __init__(self, name: str, metadata: dict[str, Any] | None = None):
         """Initialize profiler context.
 
@@ -143,29 +149,29 @@ class ProfilerContext:
         )
 
 
-@asynccontextmanager
-async def async_profile_context(
-    name: str, metadata: dict[str, Any] | None = None
-) -> AsyncIterator[ProfilerContext]:
-    """Async context manager for profiling.
+class _AsyncProfileContext:
+    """Async counterpart of ProfilerContext returned by async_profile_context."""
 
-    Example:
-        >>> async with async_profile_context("api_call") as ctx:
-        ...     result = await call_api()
-    """
-    ctx = ProfilerContext(name, metadata)
-    ctx.start_time = time.perf_counter()
+    __slots__ = ("_ctx",)
 
-    try:
-        yield ctx
-    except Exception as e:
-        ctx.success = False
-        ctx.error = str(e)
-        raise
-    finally:
+    def __init__(self, name: str, metadata: dict[str, Any] | None) -> None:
+        self._ctx = ProfilerContext(name, metadata)
+
+    async def __aenter__(self) -> ProfilerContext:
+        """Start timing."""
+        self._ctx.start_time = time.perf_counter()
+        return self._ctx
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Stop timing and record result."""
+        ctx = self._ctx
         ctx.end_time = time.perf_counter()
         ctx.duration_ms = (ctx.end_time - ctx.start_time) * 1000
 
+        if exc_type is not None and issubclass(exc_type, Exception):
+            ctx.success = False
+            ctx.error = str(exc_val)
+
         _get_logger().debug(
             "async_profile_complete",
             name=ctx.name,
@@ -177,6 +183,18 @@ async def async_profile_context(
         PerformanceCollector.get_instance().record(ctx.get_result())
 
 
+def async_profile_context(
+    name: str, metadata: dict[str, Any] | None = None
+) -> _AsyncProfileContext:
+    """Async context manager for profiling.
+
+    Example:
+        >>> async with async_profile_context("api_call") as ctx:
+        ...     result = await call_api()
+    """
+    return _AsyncProfileContext(name, metadata)
+
+
 def profile(func: F) -> F:
     """Decorator to profile a function.
 
@@ -194,6 +212,8 @@ def profile(func: F) -> F:
 
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _PROFILE_ENABLED.get():
+                return await func(*args, **kwargs)
             async with async_profile_context(func.__name__):
                 result = await func(*args, **kwargs)
                 return result
@@ -204,6 +224,8 @@ def profile(func: F) -> F:
 
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _PROFILE_ENABLED.get():
+                return func(*args, **kwargs)
             with ProfilerContext(func.__name__):
                 result = func(*args, **kwargs)
                 return result
@@ -228,6 +250,8 @@ class PerformanceCollector:
         """Initialize collector."""
         self.results: list[ProfileResult] = []
         self.enabled = True
+        # Running [count, total_ms, min_ms, max_ms, successes] per name
+        self._stats: dict[str, list[float]] = {}
 
     @classmethod
     def get_instance(cls) -> "PerformanceCollector":
@@ -245,6 +269,18 @@ class PerformanceCollector:
         """Record a profile result."""
         if self.enabled:
             self.results.append(result)
+            duration = result.duration_ms
+            stats = self._stats.get(result.name)
+            if stats is None:
+                self._stats[result.name] = [1, duration, duration, duration, int(result.success)]
+            else:
+                stats[0] += 1
+                stats[1] += duration
+                if duration < stats[2]:
+                    stats[2] = duration
+                if duration > stats[3]:
+                    stats[3] = duration
+                stats[4] += result.success
 
     def get_results(self) -> list[ProfileResult]:
         """Get all collected results."""
@@ -266,28 +302,17 @@ class PerformanceCollector:
             - max_ms: Maximum time
             - success_rate: Success rate (0-1)
         """
-        grouped: dict[str, list[float]] = defaultdict(list)
-        success_counts: dict[str, int] = defaultdict(int)
-        total_counts: dict[str, int] = defaultdict(int)
-
-        for result in self.results:
-            grouped[result.name].append(result.duration_ms)
-            total_counts[result.name] += 1
-            if result.success:
-                success_counts[result.name] += 1
-
-        stats = {}
-        for name, durations in grouped.items():
-            stats[name] = {
-                "count": len(durations),
-                "total_ms": sum(durations),
-                "mean_ms": sum(durations) / len(durations),
-                "min_ms": min(durations),
-                "max_ms": max(durations),
-                "success_rate": success_counts[name] / total_counts[name],
+        return {
+            name: {
+                "count": count,
+                "total_ms": total,
+                "mean_ms": total / count,
+                "min_ms": min_ms,
+                "max_ms": max_ms,
+                "success_rate": successes / count,
             }
-
-        return stats
+            for name, (count, total, min_ms, max_ms, successes) in self._stats.items()
+        }
 
     def export_json(self, path: str | Path) -> None:
         """Export results to JSON file.
@@ -311,6 +336,7 @@ class PerformanceCollector:
     def clear(self) -> None:
         """Clear all collected results."""
         self.results.clear()
+        self._stats.clear()
         _get_logger().info("performance_data_cleared")
 
     def disable(self) -> None:
@@ -14,8 +14,9 @@ Design Decision DD-015: Cache layers for fetch, extract, summarize.
 """
 
 import asyncio
+import contextlib
 import hashlib
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator
 
 import structlog
 from openai import AsyncOpenAI
@@ -31,6 +32,11 @@ from mcp_web.security import (
 )
 from mcp_web.utils import TokenCounter
 
+try:
+    from blake3 import blake3 as _content_hasher
+except ImportError:  # Optional "fast" extra; SHA-256 keeps the same 64-char digest
+    _content_hasher = hashlib.sha256
+
 logger: structlog.stdlib.BoundLogger | None = None
 
 
@@ -42,6 +48,46 @@ def _get_logger() -> structlog.stdlib.BoundLogger:
     return logger
 
 
+# Response chunks the LLM stream may run ahead of a slow consumer
+_PREFETCH_LIMIT = 32
+
+
+async def _prefetch(
+    source: AsyncIterator[str], maxsize: int = _PREFETCH_LIMIT
+) -> AsyncGenerator[str, None]:
+    """Drain ``source`` in a producer task through a bounded queue.
+
+    The LLM stream keeps flowing while the consumer is busy, and the queue
+    bound applies backpressure so a stalled consumer cannot buffer an
+    unbounded response. Items are yielded in order; producer errors are
+    re-raised, and closing the consumer cancels the producer.
+    """
+    queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize)
+
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception:
+            await queue.put(None)  # Wake the consumer to re-raise
+            raise
+        finally:
+            if isinstance(source, AsyncGenerator):
+                await source.aclose()
+        await queue.put(None)  # End of stream
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (item := await queue.get()) is not None:
+            yield item
+        await producer  # Re-raise producer errors
+    finally:
+        if not producer.done():
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+
 class Summarizer:
     """LLM-based content summarizer.
 
@@ -112,7 +158,7 @@ class Summarizer:
             Summary text chunks (streaming)
 
         Note:
-            Caching is content-based (SHA-256 hash) to deduplicate identical
+            Caching is content-based (BLAKE3 or SHA-256 hash) to deduplicate identical
             content from different sources.
         """
         import time
@@ -125,7 +171,8 @@ class Summarizer:
 
         start_time = time.perf_counter()
 
-        # Check cache first
+        # Check cache first; the key is reused to store the result
+        cache_key: str | None = None
         if use_cache and self.cache:
             content_hash = self._compute_content_hash(chunks)
             cache_key = CacheKeyBuilder.summary_key(
@@ -154,41 +201,28 @@ class Summarizer:
             # Decide strategy: direct or map-reduce
             if total_tokens <= self.config.map_reduce_threshold:
                 # Direct summarization
-                async for response_chunk in self._summarize_direct(chunks, query, sources):
+                strategy = self._summarize_direct(chunks, query, sources)
+            elif self.config.streaming_map:
+                # Map-reduce for large documents, streaming as_completed
+                strategy = self._summarize_map_reduce_streaming(chunks, query, sources)
+            elif self.config.parallel_map:
+                # Map-reduce for large documents, parallel gather
+                strategy = self._summarize_map_reduce(chunks, query, sources)
+            else:
+                # Sequential fallback (original implementation)
+                strategy = self._summarize_map_reduce_sequential(chunks, query, sources)
+
+            # The LLM stream runs ahead in a producer task, bounded by a queue
+            async with contextlib.aclosing(_prefetch(strategy)) as stream:
+                async for response_chunk in stream:
                     accumulated_output.append(response_chunk)
                     yield response_chunk
-            else:
-                # Map-reduce for large documents
-                # Choose between parallel gather or streaming as_completed
-                if self.config.streaming_map:
-                    async for response_chunk in self._summarize_map_reduce_streaming(
-                        chunks, query, sources
-                    ):
-                        accumulated_output.append(response_chunk)
-                        yield response_chunk
-                elif self.config.parallel_map:
-                    async for response_chunk in self._summarize_map_reduce(chunks, query, sources):
-                        accumulated_output.append(response_chunk)
-                        yield response_chunk
-                else:
-                    # Sequential fallback (original implementation)
-                    async for response_chunk in self._summarize_map_reduce_sequential(
-                        chunks, query, sources
-                    ):
-                        accumulated_output.append(response_chunk)
-                        yield response_chunk
 
             duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Cache the result
-            if use_cache and self.cache and accumulated_output:
+            if self.cache and cache_key is not None and accumulated_output:
                 full_summary = "".join(accumulated_output)
-                content_hash = self._compute_content_hash(chunks)
-                cache_key = CacheKeyBuilder.summary_key(
-                    content_hash=content_hash,
-                    query=query,
-                    model=self.config.model,
-                )
                 await self.cache.set(cache_key, full_summary)
                 _get_logger().info(
                     "summarization_cached",
@@ -697,20 +731,25 @@ class Summarizer:
         return "\n".join(parts)
 
     def _compute_content_hash(self, chunks: list[Chunk]) -> str:
-        """Compute SHA-256 hash of chunk content for cache key.
+        """Compute hash of chunk content for cache key.
+
+        Uses BLAKE3 when the optional ``blake3`` package is installed, and
+        SHA-256 otherwise. Both produce a 64-char hex digest.
 
         Args:
             chunks: List of chunks to hash
 
         Returns:
-            Hex-encoded SHA-256 hash
+            Hex-encoded 256-bit hash
 
         Note:
-            Hash is based on concatenated chunk text to identify identical
-            content regardless of source URL.
+            Hash is based on NUL-delimited chunk text to identify identical
+            content regardless of source URL, while keeping chunk boundaries
+            significant.
         """
-        content = "".join(chunk.text for chunk in chunks)
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        content = "\x00".join(chunk.text for chunk in chunks)
+        digest: str = _content_hasher(content.encode("utf-8")).hexdigest()
+        return digest
 
     async def close(self) -> None:
         """Close LLM client."""
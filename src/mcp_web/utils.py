@@ -8,25 +8,44 @@ Provides shared helpers for:
 """
 
 import re
-from typing import Any
+from functools import cache
+from typing import Any, Protocol
 from urllib.parse import urlparse
 
 import tiktoken
 
 
+@cache
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process, shared by all counters."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+class Encoder(Protocol):
+    """Subset of the tiktoken encoding interface used by TokenCounter."""
+
+    def encode(self, text: str) -> list[Any]: ...
+
+    def encode_batch(self, text: list[str]) -> list[list[Any]]: ...
+
+    def decode(self, tokens: list[Any]) -> str: ...
+
+
 class TokenCounter:
     """Token counting utilities using tiktoken.
 
     Design Decision DD-005: Use tiktoken for accurate OpenAI model token counts.
     """
 
-    def __init__(self, encoding_name: str = "cl100k_base"):
+    def __init__(self, encoding_name: str = "cl100k_base", encoder: Encoder | None = None):
         """Initialize token counter.
 
         Args:
             encoding_name: Tiktoken encoding (default: cl100k_base for GPT-4/3.5)
+            encoder: Pre-built encoder to use instead of loading ``encoding_name``
+                (e.g. a cheap stand-in where only relative counts matter)
         """
-        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.encoding: Encoder = encoder if encoder is not None else _get_encoding(encoding_name)
         self.encoding_name = encoding_name
 
     def count_tokens(self, text: str) -> int:
@@ -45,6 +64,22 @@ class TokenCounter:
         """
         return len(self.encoding.encode(text))
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens in several texts with one batched encode.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Number of tokens for each text, in order
+
+        Example:
+            >>> counter = TokenCounter()
+            >>> counter.count_tokens_batch(["Hello, world!", ""])
+            [4, 0]
+        """
+        return [len(tokens) for tokens in self.encoding.encode_batch(texts)]
+
     def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
         """Truncate text to maximum token count.
 
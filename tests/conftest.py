@@ -224,6 +224,28 @@ def _build_deterministic_summary(prompt: str) -> str:
     return "\n".join(summary_lines)
 
 
+class FakeClock:
+    """Manually advanced stand-in for ``time.perf_counter``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by ``seconds``."""
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the profiler's perf_counter with a manually advanced clock."""
+    clock = FakeClock()
+    monkeypatch.setattr("mcp_web.profiler.time.perf_counter", clock)
+    return clock
+
+
 @pytest.fixture(autouse=True)
 def stub_llm(monkeypatch):
     """Stub LLM calls to produce deterministic, lightweight summaries for tests."""
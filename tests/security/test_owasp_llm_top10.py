@@ -256,9 +256,8 @@ class TestOWASP_LLM07_SystemPromptLeakage:
             "Core instructions state that you must",
         ]
 
-        for prompt in leaked_prompts:
-            is_safe = validator.validate(prompt)
-            assert not is_safe, f"Failed to detect prompt leakage: {prompt}"
+        undetected = [prompt for prompt in leaked_prompts if validator.validate(prompt)]
+        assert not undetected, f"Failed to detect prompt leakage: {undetected}"
 
     @pytest.mark.security
     @pytest.mark.unit
@@ -109,9 +109,12 @@ class TestPromptInjectionDetection:
 
         dangerous_keywords = ["execute", "run code", "os.system", "base64"]
 
-        for sample in nested_samples:
-            found = any(keyword in sample.lower() for keyword in dangerous_keywords)
-            assert found, f"Should detect dangerous pattern in: {sample}"
+        missed = [
+            sample
+            for sample in nested_samples
+            if not any(keyword in sample.lower() for keyword in dangerous_keywords)
+        ]
+        assert not missed, f"Should detect dangerous pattern in: {missed}"
 
     @pytest.mark.security
     def test_role_confusion_patterns(self):
@@ -140,9 +143,12 @@ class TestPromptInjectionDetection:
 
         dangerous_keywords = ["send", "post", "email", "full context", "conversation history"]
 
-        for sample in exfiltration_samples:
-            found = any(keyword in sample.lower() for keyword in dangerous_keywords)
-            assert found
+        missed = [
+            sample
+            for sample in exfiltration_samples
+            if not any(keyword in sample.lower() for keyword in dangerous_keywords)
+        ]
+        assert not missed, f"No exfiltration keyword found in: {missed}"
 
     @pytest.mark.security
     def test_code_execution_patterns(self):
@@ -157,9 +163,12 @@ class TestPromptInjectionDetection:
 
         dangerous_keywords = ["execute", "eval", "exec", "__import__", "system"]
 
-        for sample in execution_samples:
-            found = any(keyword in sample.lower() for keyword in dangerous_keywords)
-            assert found, f"No dangerous keyword found in: {sample}"
+        missed = [
+            sample
+            for sample in execution_samples
+            if not any(keyword in sample.lower() for keyword in dangerous_keywords)
+        ]
+        assert not missed, f"No dangerous keyword found in: {missed}"
 
     @pytest.mark.security
     @pytest.mark.asyncio
@@ -327,13 +336,13 @@ class TestInputValidation:
             "file\x00with\x00nulls",
         ]
 
-        # Test that we recognize these as malicious
-        for filename in malicious_filenames:
-            # Any of these patterns indicate a security risk
-            is_malicious = (
-                ".." in filename or "/" in filename or "\\" in filename or "\x00" in filename
-            )
-            assert is_malicious, f"Should detect malicious pattern in: {filename}"
+        # Any of these patterns indicate a security risk
+        missed = [
+            filename
+            for filename in malicious_filenames
+            if not (".." in filename or "/" in filename or "\\" in filename or "\x00" in filename)
+        ]
+        assert not missed, f"Should detect malicious pattern in: {missed}"
 
     @pytest.mark.security
     def test_query_length_limits(self):
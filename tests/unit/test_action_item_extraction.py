@@ -113,6 +113,25 @@ def test_action_item_schema_defaults():
     assert item.blockers is None
 
 
+@pytest.mark.unit
+def test_action_item_session_date_shared_per_day():
+    """Items from the same session day share one date instance."""
+    fields = {
+        "title": "Test item",
+        "description": "Test description",
+        "category": "automation",
+        "impact": "high",
+        "confidence": "high",
+        "source_summary": "test.md",
+        "source_section": "Section",
+    }
+    first = ActionItem(id="test-1", session_date="2025-10-20", **fields)
+    second = ActionItem(id="test-2", session_date=date(2025, 10, 20), **fields)
+
+    assert first.session_date == date(2025, 10, 20)
+    assert first.session_date is second.session_date
+
+
 # ============================================================================
 # Section Parsing Tests
 # ============================================================================
@@ -763,5 +782,5 @@ def test_map_action_item_to_initiatives(tmp_path):
     matches = map_action_item_to_initiatives(item, initiatives)
 
     assert len(matches) == 1
-    assert matches[0]["title"] == "Initiative A"
-    assert matches[0]["overlap_score"] == 1.0
+    assert matches[0].title == "Initiative A"
+    assert matches[0].overlap_score == 1.0
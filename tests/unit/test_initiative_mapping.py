@@ -11,6 +11,9 @@ import pytest
 
 from scripts.automation.extract_action_items import (
     ActionItem,
+    InitiativeMatch,
+    InitiativeTable,
+    build_initiative_index,
     load_initiative_metadata,
     map_action_item_to_initiatives,
     should_create_new_initiative,
@@ -190,9 +193,9 @@ def test_map_action_item_high_overlap():
 
     # Should match caching initiative with high overlap
     assert len(matches) >= 1
-    assert matches[0]["title"] == "Caching System Overhaul"
+    assert matches[0].title == "Caching System Overhaul"
     # Overlap: 2 files in common out of 3 total = 2/3 = 0.67
-    assert matches[0]["overlap_score"] > 0.6
+    assert matches[0].overlap_score > 0.6
 
 
 @pytest.mark.unit
@@ -324,9 +327,46 @@ def test_map_action_item_multiple_matches_sorted():
     # Should return both matches, sorted by overlap score
     assert len(matches) == 2
     # First match should have higher overlap
-    assert matches[0]["overlap_score"] >= matches[1]["overlap_score"]
+    assert matches[0].overlap_score >= matches[1].overlap_score
     # Database Optimization has 2/3 = 0.67, General Performance has 1/4 = 0.25
-    assert matches[0]["title"] == "Database Optimization"
+    assert matches[0].title == "Database Optimization"
+
+
+@pytest.mark.unit
+def test_map_action_item_top_k_returns_best_matches():
+    """top_k limits results to the highest-scoring initiatives."""
+    item = ActionItem(
+        id="test-1",
+        title="Improve performance",
+        description="Optimize database queries",
+        category="performance",
+        impact="high",
+        confidence="high",
+        source_summary="summary.md",
+        source_section="Performance",
+        session_date=date(2025, 10, 20),
+        related_files=["src/database.py", "src/query.py"],
+    )
+
+    initiatives = [
+        {
+            "title": "General Performance",
+            "status": "Active",
+            "path": "/path/to/perf.md",
+            "related_files": ["src/database.py", "src/cache.py", "src/config.py"],
+        },
+        {
+            "title": "Database Optimization",
+            "status": "Active",
+            "path": "/path/to/db.md",
+            "related_files": ["src/database.py", "src/query.py", "tests/test_db.py"],
+        },
+    ]
+
+    matches = map_action_item_to_initiatives(item, initiatives, top_k=1)
+
+    assert [m.title for m in matches] == ["Database Optimization"]
+    assert matches == map_action_item_to_initiatives(item, initiatives)[:1]
 
 
 @pytest.mark.unit
@@ -360,6 +400,188 @@ def test_map_action_item_partial_file_path_match():
     assert matches == []
 
 
+@pytest.mark.unit
+def test_map_action_item_min_score_filters_weak_matches():
+    """Matches below min_score are dropped, including size-bound pruned ones."""
+    item = ActionItem(
+        id="test-1",
+        title="Improve performance",
+        description="Optimize database queries",
+        category="performance",
+        impact="high",
+        confidence="high",
+        source_summary="summary.md",
+        source_section="Performance",
+        session_date=date(2025, 10, 20),
+        related_files=["src/database.py", "src/query.py"],
+    )
+
+    initiatives = [
+        {
+            "title": "Database Optimization",
+            "status": "Active",
+            "path": "/path/to/db.md",
+            "related_files": ["src/database.py", "src/query.py", "tests/test_db.py"],
+        },
+        {
+            "title": "General Performance",
+            "status": "Active",
+            "path": "/path/to/perf.md",
+            "related_files": ["src/database.py", "src/cache.py", "src/config.py"],
+        },
+        {
+            "title": "Everything",
+            "status": "Active",
+            "path": "/path/to/all.md",
+            "related_files": ["src/database.py"] + [f"src/mod{i}.py" for i in range(9)],
+        },
+    ]
+
+    matches = map_action_item_to_initiatives(item, initiatives, min_score=0.3)
+
+    # 0.25 and 0.09 fall below the cutoff; only the 0.67 match survives
+    assert [m.title for m in matches] == ["Database Optimization"]
+
+
+@pytest.mark.unit
+def test_map_action_item_initiative_table_matches_dicts():
+    """Prebuilt InitiativeTable yields the same matches as the dict input."""
+    item = ActionItem(
+        id="test-1",
+        title="Fix caching bug",
+        description="Cache not invalidating correctly",
+        category="regression",
+        impact="high",
+        confidence="high",
+        source_summary="summary.md",
+        source_section="Bugs",
+        session_date=date(2025, 10, 20),
+        related_files=["src/cache.py", "tests/test_cache.py"],
+    )
+
+    initiatives = [
+        {
+            "title": "Caching System Overhaul",
+            "status": "Active",
+            "path": "/path/to/caching-initiative.md",
+            "related_files": ["src/cache.py", "tests/test_cache.py", "src/config.py"],
+        },
+        {
+            "title": "Cache Tests",
+            "status": "Completed",
+            "path": "/path/to/cache-tests.md",
+            "related_files": ["tests/test_cache.py"],
+        },
+    ]
+
+    table = InitiativeTable.from_dicts(initiatives)
+
+    assert len(table) == 2
+    assert table.paths == ["/path/to/caching-initiative.md", "/path/to/cache-tests.md"]
+    assert table.mask_for(frozenset({"tests/test_cache.py", "unknown.py"})) == table.file_masks[1]
+    assert map_action_item_to_initiatives(item, table) == map_action_item_to_initiatives(
+        item, initiatives
+    )
+
+
+@pytest.mark.unit
+def test_map_action_item_repeat_calls_return_independent_results():
+    """Matches memoized on a table are returned in a fresh list per call."""
+    item = ActionItem(
+        id="test-1",
+        title="Fix caching bug",
+        description="Cache not invalidating correctly",
+        category="regression",
+        impact="high",
+        confidence="high",
+        source_summary="summary.md",
+        source_section="Bugs",
+        session_date=date(2025, 10, 20),
+        related_files=["src/cache.py"],
+    )
+
+    initiatives = [
+        {
+            "title": "Caching System",
+            "status": "Active",
+            "path": "/path/to/caching.md",
+            "related_files": ["src/cache.py", "tests/test_cache.py"],
+        }
+    ]
+
+    table = InitiativeTable.from_dicts(initiatives)
+
+    first = map_action_item_to_initiatives(item, table)
+    first.clear()
+
+    second = map_action_item_to_initiatives(item, table)
+    assert second == [
+        InitiativeMatch(
+            title="Caching System",
+            status="Active",
+            path="/path/to/caching.md",
+            overlap_score=0.5,
+            matching_files=("src/cache.py",),
+        )
+    ]
+    assert len(table.match_cache) == 1
+
+    # Dict input is scored afresh, so edited initiatives are picked up
+    initiatives[0]["status"] = "Completed"
+    assert map_action_item_to_initiatives(item, initiatives)[0].status == "Completed"
+
+
+@pytest.mark.unit
+def test_map_action_item_path_change_is_not_served_from_cache():
+    """Initiatives differing only by path yield their own paths."""
+    item = ActionItem(
+        id="test-1",
+        title="Fix caching bug",
+        description="Cache not invalidating correctly",
+        category="regression",
+        impact="high",
+        confidence="high",
+        source_summary="summary.md",
+        source_section="Bugs",
+        session_date=date(2025, 10, 20),
+        related_files=["src/cache.py"],
+    )
+
+    def initiatives(path: str) -> list[dict]:
+        return [
+            {
+                "title": "Caching System",
+                "status": "Active",
+                "path": path,
+                "related_files": ["src/cache.py"],
+            }
+        ]
+
+    old = map_action_item_to_initiatives(item, initiatives("docs/initiatives/active/old.md"))
+    new = map_action_item_to_initiatives(item, initiatives("docs/initiatives/active/new.md"))
+
+    assert old[0].path == "docs/initiatives/active/old.md"
+    assert new[0].path == "docs/initiatives/active/new.md"
+
+
+@pytest.mark.unit
+def test_build_initiative_index():
+    """Reverse index maps each file to the initiatives that mention it."""
+    file_sets = [
+        frozenset({"src/cache.py", "tests/test_cache.py"}),
+        frozenset(),
+        frozenset({"src/cache.py", "src/config.py"}),
+    ]
+
+    index = build_initiative_index(file_sets)
+
+    assert index == {
+        "src/cache.py": [0, 2],
+        "tests/test_cache.py": [0],
+        "src/config.py": [2],
+    }
+
+
 # ============================================================================
 # Auto-Creation Heuristic Tests
 # ============================================================================
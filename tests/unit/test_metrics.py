@@ -0,0 +1,545 @@
+"""Unit tests for metrics module."""
+
+import copy
+import json
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+import mcp_web.metrics
+from mcp_web.metrics import (
+    CacheMetrics,
+    ChunkingMetrics,
+    ExtractionMetrics,
+    FetchMetrics,
+    MetricsCollector,
+    SummarizationMetrics,
+    configure_logging,
+    get_metrics_collector,
+    reset_global_collector,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="session")
+def _collector_template():
+    """Pristine collector constructed once per session."""
+    return MetricsCollector(enabled=True)
+
+
+class TestMetricDataclasses:
+    """Tests for metric dataclasses."""
+
+    @pytest.mark.parametrize(
+        ("cls", "kwargs", "expected"),
+        [
+            (
+                FetchMetrics,
+                {
+                    "url": "https://example.com",
+                    "method": "httpx",
+                    "duration_ms": 125.5,
+                    "status_code": 200,
+                    "content_size": 5000,
+                    "success": True,
+                },
+                {"method": "httpx", "duration_ms": 125.5, "error": None},
+            ),
+            (
+                ExtractionMetrics,
+                {
+                    "url": "https://example.com",
+                    "content_length": 10000,
+                    "extracted_length": 2500,
+                    "extraction_ratio": 0.25,
+                    "duration_ms": 50.0,
+                    "success": True,
+                },
+                {"extraction_ratio": 0.25, "error": None},
+            ),
+            (
+                ChunkingMetrics,
+                {
+                    "content_length": 5000,
+                    "num_chunks": 10,
+                    "avg_chunk_size": 500.0,
+                    "duration_ms": 20.0,
+                    "strategy": "hierarchical",
+                    "adaptive_enabled": False,
+                    "target_chunk_size": 512,
+                },
+                {"num_chunks": 10, "strategy": "hierarchical"},
+            ),
+            (
+                SummarizationMetrics,
+                {
+                    "input_tokens": 1000,
+                    "output_tokens": 200,
+                    "model": "gpt-4o-mini",
+                    "duration_ms": 1500.0,
+                    "cost_estimate": 0.00027,
+                    "success": True,
+                },
+                {"model": "gpt-4o-mini", "cost_estimate": 0.00027, "error": None},
+            ),
+            (
+                CacheMetrics,
+                {"operation": "hit", "key": "fetch:abc"},
+                {"operation": "hit", "size_bytes": None},
+            ),
+        ],
+        ids=["fetch", "extraction", "chunking", "summarization", "cache"],
+    )
+    def test_metrics_creation(self, cls, kwargs, expected):
+        """Test metric dataclasses store fields and apply defaults."""
+        metric = cls(**kwargs)
+
+        for name, value in expected.items():
+            assert getattr(metric, name) == value
+        assert metric.timestamp is not None
+
+
+@pytest.fixture(scope="module")
+def disabled_collector():
+    """Disabled collector; shared because recording is a no-op."""
+    return MetricsCollector(enabled=False)
+
+
+class TestMetricsCollector:
+    """Tests for MetricsCollector."""
+
+    @pytest.fixture
+    def collector(self, _collector_template):
+        """Create MetricsCollector instance from the cached template."""
+        return copy.copy(_collector_template)
+
+    def test_copy_isolates_storage(self, collector):
+        """Test copies do not share recorded metrics."""
+        collector.record_fetch("https://example.com", "httpx", 125.5, 200, 5000, True)
+        clone = copy.copy(collector)
+        clone.record_fetch("https://example.org", "httpx", 80.0, 200, 1000, True)
+        clone.record_error("fetcher", ValueError("clone only"))
+
+        assert len(collector.fetch_metrics) == 1
+        assert len(clone.fetch_metrics) == 2
+        assert collector.counters["fetch_httpx"] == 1
+        assert clone.counters["fetch_httpx"] == 2
+        assert collector.timers["fetch_httpx_duration"] == (125.5, 1)
+        assert collector.errors == []
+        assert len(clone.errors) == 1
+
+    def test_record_fetch(self, collector):
+        """Test recording fetch metrics."""
+        collector.record_fetch("https://example.com", "httpx", 125.5, 200, 5000, True)
+
+        assert len(collector.fetch_metrics) == 1
+        assert collector.fetch_metrics[0].url == "https://example.com"
+        assert collector.counters["fetch_httpx"] == 1
+        assert collector.timers["fetch_httpx_duration"] == (125.5, 1)
+        assert collector.counters["fetch_errors"] == 0
+
+    def test_record_fetch_failure(self, collector):
+        """Test failed fetches increment the error counter."""
+        collector.record_fetch(
+            "https://example.com", "playwright", 3000.0, 500, 0, False, error="Server error"
+        )
+
+        assert collector.counters["fetch_playwright"] == 1
+        assert collector.counters["fetch_errors"] == 1
+        assert collector.fetch_metrics[0].error == "Server error"
+
+    def test_record_extraction(self, collector):
+        """Test recording extraction metrics."""
+        collector.record_extraction("https://example.com", 10000, 2500, 50.0, True)
+
+        assert collector.extraction_metrics[0].extraction_ratio == 0.25
+        assert collector.counters["extractions"] == 1
+        assert collector.timers["extraction_duration"] == (50.0, 1)
+
+    def test_record_extraction_zero_content(self, collector):
+        """Test extraction ratio is 0 for empty content."""
+        collector.record_extraction("https://example.com", 0, 0, 5.0, False, error="Empty")
+
+        assert collector.extraction_metrics[0].extraction_ratio == 0.0
+        assert collector.counters["extraction_errors"] == 1
+
+    def test_record_chunking(self, collector):
+        """Test recording chunking metrics."""
+        collector.record_chunking(
+            5000,
+            10,
+            500.0,
+            20.0,
+            strategy="hierarchical",
+            adaptive_enabled=True,
+            target_chunk_size=512,
+        )
+
+        assert collector.counters["chunking_operations"] == 1
+        assert collector.counters["chunking_strategy_hierarchical"] == 1
+        assert collector.counters["chunking_adaptive_enabled"] == 1
+        assert collector.timers["chunking_duration"] == (20.0, 1)
+
+    def test_record_summarization(self, collector):
+        """Test recording summarization metrics."""
+        collector.record_summarization(1000, 200, "gpt-4o-mini", 1500.0, True)
+
+        assert collector.counters["summarizations"] == 1
+        assert collector.counters["total_input_tokens"] == 1000
+        assert collector.counters["total_output_tokens"] == 200
+        assert collector.timers["summarization_duration"] == (1500.0, 1)
+
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            ("gpt-4o-mini", 1000 * 1.5e-7 + 200 * 6.0e-7),
+            ("gpt-4", 1000 * 3.0e-5 + 200 * 6.0e-5),
+            ("llama3.2:3b", 1000 * 1.5e-7 + 200 * 6.0e-7),
+        ],
+        ids=["gpt-4o-mini", "gpt-4", "unknown-model-default"],
+    )
+    def test_cost_estimation(self, collector, model, expected):
+        """Test summarization cost uses per-token model rates."""
+        collector.record_summarization(1000, 200, model, 1500.0, True)
+
+        assert collector.summarization_metrics[0].cost_estimate == pytest.approx(expected)
+
+    def test_timer_context_manager(self, collector):
+        """Test timer records elapsed milliseconds."""
+        with patch("mcp_web.metrics.time.perf_counter", side_effect=[0.0, 0.025]):
+            with collector.timer("test_operation"):
+                pass
+
+        assert collector.timers["test_operation"] == (25.0, 1)
+
+    def test_timer_records_on_exception(self, collector):
+        """Test timer still records when the block raises."""
+        with patch("mcp_web.metrics.time.perf_counter", side_effect=[1.0, 1.5]):
+            with pytest.raises(RuntimeError), collector.timer("failing_operation"):
+                raise RuntimeError("boom")
+
+        assert collector.timers["failing_operation"] == (500.0, 1)
+
+    @pytest.mark.parametrize(
+        ("ops", "expected_counters", "expected_rate"),
+        [
+            (
+                ["hit", "miss", "set", "evict", "delete", "expire"],
+                {
+                    "cache_hit": 1,
+                    "cache_miss": 1,
+                    "cache_set": 1,
+                    "cache_evict": 1,
+                    "cache_delete": 1,
+                    "cache_expire": 1,
+                },
+                0.5,
+            ),
+            (["hit"] * 3 + ["miss"] * 2, {"cache_hit": 3, "cache_miss": 2}, 0.6),
+            (["set", "delete"], {"cache_set": 1, "cache_delete": 1}, 0.0),
+        ],
+        ids=["all-operations", "hit-rate", "no-lookups"],
+    )
+    def test_record_cache_operations(self, collector, ops, expected_counters, expected_rate):
+        """Test cache operation counters and the derived hit rate."""
+        for op in ops:
+            collector.record_cache_operation(op, "fetch:example")
+
+        assert dict(collector.counters) == expected_counters
+        assert collector.export_metrics()["summary"]["cache_hit_rate"] == pytest.approx(
+            expected_rate
+        )
+
+    def test_record_error(self, collector):
+        """Test recording errors."""
+        collector.record_error("fetcher", ValueError("Invalid URL"), {"url": "bad"})
+
+        assert len(collector.errors) == 1
+        assert collector.errors[0]["module"] == "fetcher"
+        assert collector.errors[0]["error_type"] == "ValueError"
+        assert collector.errors[0]["error_message"] == "Invalid URL"
+        assert collector.errors[0]["context"] == {"url": "bad"}
+        assert collector.counters["error_fetcher"] == 1
+
+    def test_collector_disabled(self, disabled_collector):
+        """Test disabled collector records nothing."""
+        disabled_collector.record_fetch("https://example.com", "httpx", 125.5, 200, 5000, True)
+        disabled_collector.record_error("fetcher", ValueError("ignored"))
+        disabled_collector.record_batch(
+            [("cache_operation", {"operation": "hit", "key": "fetch:example"})]
+        )
+
+        assert disabled_collector.fetch_metrics == []
+        assert disabled_collector.errors == []
+        assert disabled_collector.counters == {}
+
+    def test_export_metrics_cached_until_mutation(self, collector):
+        """Test export is reused until new metrics are recorded."""
+        collector.record_fetch("https://example.com", "httpx", 100.0, 200, 5000, True)
+
+        first = collector.export_metrics()
+        assert collector.export_metrics() == first
+
+        collector.record_cache_operation("hit", "fetch:example")
+        second = collector.export_metrics()
+        assert second != first
+        assert second["summary"]["cache_hit_rate"] == 1.0
+
+        collector.reset()
+        assert collector.export_metrics()["summary"]["total_fetches"] == 0
+
+    def test_export_metrics_copies_are_independent(self, collector):
+        """Test modifying an export leaves the cached aggregation intact."""
+        collector.record_fetch("https://example.com", "httpx", 100.0, 200, 5000, True)
+        collector.record_error("fetcher", ValueError("boom"))
+
+        first = collector.export_metrics()
+        first["summary"]["total_fetches"] = 99
+        first["counters"].clear()
+        first["errors"][0]["module"] = "changed"
+        first["avg_durations_ms"] = {}
+
+        second = collector.export_metrics()
+        assert second is not first
+        assert second["summary"]["total_fetches"] == 1
+        assert second["counters"]
+        assert second["errors"][0]["module"] == "fetcher"
+        assert second["avg_durations_ms"]
+
+    def test_save_metrics_to_file(self, collector, tmp_path):
+        """Test saving metrics to JSON file."""
+        collector.record_fetch("https://example.com", "httpx", 125.5, 200, 5000, True)
+        output_path = tmp_path / "metrics.json"
+
+        collector.save_metrics(output_path)
+
+        data = json.loads(output_path.read_text())
+        assert data["summary"]["total_fetches"] == 1
+        assert data["counters"]["fetch_httpx"] == 1
+
+    def test_save_metrics_creates_directory(self, collector, tmp_path):
+        """Test saving metrics creates missing parent directories."""
+        output_path = tmp_path / "nested" / "dir" / "metrics.json"
+
+        collector.save_metrics(output_path)
+
+        assert output_path.exists()
+
+    def test_save_metrics_without_path(self, collector, tmp_path):
+        """Test saving without a path or export_path is a no-op."""
+        collector.save_metrics()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_reset(self, collector):
+        """Test resetting all metrics."""
+        collector.record_fetch("https://example.com", "httpx", 125.5, 200, 5000, True)
+        collector.record_error("fetcher", ValueError("boom"))
+
+        collector.reset()
+
+        assert collector.fetch_metrics == []
+        assert collector.errors == []
+        assert dict(collector.counters) == {}
+        assert collector.timers == {}
+
+
+@pytest.fixture(scope="module")
+def populated_collector():
+    """Collector with a representative set of recorded metrics (read-only)."""
+    collector = MetricsCollector(enabled=True)
+    collector.record_fetch("https://example.com", "httpx", 100.0, 200, 5000, True)
+    collector.record_fetch("https://example.org", "httpx", 200.0, 200, 3000, True)
+    collector.record_extraction("https://example.com", 5000, 1250, 50.0, True)
+    collector.record_chunking(
+        1250, 3, 416.7, 10.0, strategy="hierarchical", adaptive_enabled=False, target_chunk_size=512
+    )
+    collector.record_summarization(1000, 200, "gpt-4o-mini", 1500.0, True)
+    collector.record_summarization(2000, 400, "gpt-4o-mini", 2500.0, True)
+    for _ in range(3):
+        collector.record_cache_operation("hit", "fetch:example")
+    for _ in range(2):
+        collector.record_cache_operation("miss", "fetch:other")
+    collector.record_error("fetcher", TimeoutError("timed out"))
+    return collector
+
+
+@pytest.fixture(scope="module")
+def exported(populated_collector):
+    """Exported metrics of the populated collector."""
+    return populated_collector.export_metrics()
+
+
+class TestMetricsExport:
+    """Tests for MetricsCollector.export_metrics aggregation."""
+
+    def test_export_metrics(self, exported):
+        """Test export structure and summary totals."""
+        assert set(exported) == {"summary", "counters", "avg_durations_ms", "errors"}
+        assert exported["summary"]["total_fetches"] == 2
+        assert exported["summary"]["total_extractions"] == 1
+        assert exported["summary"]["total_summarizations"] == 2
+        assert exported["summary"]["total_errors"] == 1
+        assert exported["counters"]["fetch_httpx"] == 2
+        assert exported["errors"][0]["error_type"] == "TimeoutError"
+
+    def test_cache_hit_rate_calculation(self, exported):
+        """Test cache hit rate is hits / (hits + misses)."""
+        assert exported["summary"]["cache_hit_rate"] == pytest.approx(0.6)
+
+    def test_average_duration_calculation(self, exported):
+        """Test average durations per timer."""
+        assert exported["avg_durations_ms"]["fetch_httpx_duration"] == pytest.approx(150.0)
+        assert exported["avg_durations_ms"]["summarization_duration"] == pytest.approx(2000.0)
+
+    def test_total_cost_aggregation(self, exported):
+        """Test summarization cost is summed and rounded."""
+        assert exported["summary"]["total_cost_usd"] == pytest.approx(0.0008)
+
+    def test_export_empty_collector(self):
+        """Test export of a collector with no metrics."""
+        metrics = MetricsCollector(enabled=True).export_metrics()
+
+        assert metrics["summary"]["cache_hit_rate"] == 0.0
+        assert metrics["summary"]["total_cost_usd"] == 0.0
+        assert metrics["avg_durations_ms"] == {}
+
+
+class TestMetricsIntegration:
+    """Tests recording a full pipeline run."""
+
+    def test_full_pipeline_metrics(self):
+        """Test metrics for fetch → extract → chunk → summarize."""
+        collector = MetricsCollector(enabled=True)
+
+        collector.record_batch(
+            [
+                (
+                    "fetch",
+                    {
+                        "url": "https://example.com",
+                        "method": "httpx",
+                        "duration_ms": 120.0,
+                        "status_code": 200,
+                        "content_size": 8000,
+                        "success": True,
+                    },
+                ),
+                (
+                    "extraction",
+                    {
+                        "url": "https://example.com",
+                        "content_length": 8000,
+                        "extracted_length": 2000,
+                        "duration_ms": 40.0,
+                        "success": True,
+                    },
+                ),
+                (
+                    "chunking",
+                    {
+                        "content_length": 2000,
+                        "num_chunks": 4,
+                        "avg_chunk_size": 500.0,
+                        "duration_ms": 5.0,
+                        "strategy": "hierarchical",
+                        "adaptive_enabled": False,
+                        "target_chunk_size": 512,
+                    },
+                ),
+                (
+                    "summarization",
+                    {
+                        "input_tokens": 1000,
+                        "output_tokens": 200,
+                        "model": "gpt-4o-mini",
+                        "duration_ms": 900.0,
+                        "success": True,
+                    },
+                ),
+                ("cache_operation", {"operation": "set", "key": "summary:example"}),
+            ]
+        )
+
+        metrics = collector.export_metrics()
+        assert metrics["summary"]["total_fetches"] == 1
+        assert metrics["summary"]["total_extractions"] == 1
+        assert metrics["summary"]["total_summarizations"] == 1
+        assert metrics["summary"]["total_errors"] == 0
+        assert metrics["counters"]["chunking_operations"] == 1
+        assert metrics["counters"]["cache_set"] == 1
+        assert metrics["avg_durations_ms"]["summarization_duration"] == 900.0
+
+    def test_record_batch_unknown_kind(self):
+        """Test unknown event kinds are rejected."""
+        collector = MetricsCollector(enabled=True)
+
+        with pytest.raises(ValueError, match="Unknown metric kind"):
+            collector.record_batch([("bogus", {})])
+
+
+class TestGlobalCollector:
+    """Tests for the process-wide collector accessors."""
+
+    def test_get_metrics_collector_creates_instance(self, monkeypatch):
+        """Test the global collector is created lazily."""
+        monkeypatch.setattr(mcp_web.metrics, "_global_collector", None)
+
+        collector = get_metrics_collector()
+
+        assert isinstance(collector, MetricsCollector)
+        assert collector.enabled
+
+    def test_global_collector_shared_state(self, monkeypatch):
+        """Test repeated lookups return the same collector until reset."""
+        monkeypatch.setattr(mcp_web.metrics, "_global_collector", None)
+
+        first = get_metrics_collector()
+        first.record_cache_operation("hit", "fetch:example")
+
+        assert get_metrics_collector() is first
+        assert get_metrics_collector().counters["cache_hit"] == 1
+
+        reset_global_collector()
+        assert get_metrics_collector() is not first
+
+
+@pytest.fixture(scope="module")
+def _restore_structlog():
+    """Restore the global structlog configuration after logging tests."""
+    snapshot = structlog.get_config()
+    yield
+    structlog.configure(**snapshot)
+
+
+@pytest.mark.usefixtures("_restore_structlog")
+class TestConfigureLogging:
+    """Tests for configure_logging."""
+
+    @pytest.mark.parametrize(
+        ("level", "structured", "renderer"),
+        [
+            ("INFO", True, structlog.processors.JSONRenderer),
+            ("DEBUG", False, structlog.dev.ConsoleRenderer),
+            ("not-a-level", True, structlog.processors.JSONRenderer),
+        ],
+    )
+    def test_configure_logging(self, level, structured, renderer):
+        """Test configuring logging selects the renderer for the output mode."""
+        configure_logging(level=level, structured=structured)
+
+        assert isinstance(structlog.get_config()["processors"][-1], renderer)
+
+    def test_configure_logging_idempotent(self):
+        """Test repeated calls keep the configuration already applied."""
+        configure_logging(level="INFO", structured=True)
+        processors = structlog.get_config()["processors"]
+
+        configure_logging(level="info", structured=True)
+        assert structlog.get_config()["processors"] is processors
+
+        structlog.reset_defaults()
+        configure_logging(level="INFO", structured=True)
+        assert structlog.get_config()["processors"] is processors
@@ -0,0 +1,271 @@
+"""Unit tests for profiler module."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from mcp_web.profiler import (
+    _PROFILE_ENABLED,
+    PerformanceCollector,
+    ProfilerContext,
+    ProfileResult,
+    async_profile_context,
+    profile,
+)
+
+
+@pytest.fixture(autouse=True)
+def collector():
+    """Global performance collector, empty and enabled for each test."""
+    collector = PerformanceCollector.get_instance()
+    collector.clear()
+    collector.enable()
+    yield collector
+    collector.clear()
+    collector.enable()
+
+
+# Shared read-only samples; the collector stores references and never mutates them
+_START = 1_700_000_000.0
+_SAMPLES = tuple(
+    ProfileResult(f"op_{i}", i * 10.0, _START + i, _START + i + i * 0.01, success=True)
+    for i in range(5)
+)
+_FAILED = ProfileResult("op_1", 30.0, _START, _START + 0.03, success=False, error="boom")
+
+
+@pytest.mark.unit
+class TestProfilerContext:
+    """Tests for ProfilerContext, async_profile_context and @profile."""
+
+    def test_basic_profiling(self, fake_clock):
+        """Test context measures the elapsed block duration."""
+        with ProfilerContext("test_op") as ctx:
+            fake_clock.advance(0.015)
+
+        assert ctx.duration_ms == pytest.approx(15.0)
+        assert ctx.success
+        assert ctx.error is None
+
+    def test_real_clock_sanity(self):
+        """Test the unpatched clock still measures real elapsed time."""
+        with ProfilerContext("real_op") as ctx:
+            time.sleep(0.01)
+
+        assert ctx.duration_ms >= 10
+
+    def test_profiling_with_error(self, fake_clock):
+        """Test exceptions mark the context failed and propagate."""
+        with pytest.raises(ValueError, match="boom"):
+            with ProfilerContext("failing_op") as ctx:
+                raise ValueError("boom")
+
+        assert not ctx.success
+        assert ctx.error == "boom"
+
+    def test_profile_sync_function(self, fake_clock, collector):
+        """Test @profile records sync functions under their name."""
+
+        @profile
+        def work():
+            fake_clock.advance(0.01)
+            return "done"
+
+        assert work() == "done"
+
+        results = collector.get_by_name("work")
+        assert len(results) == 1
+        assert results[0].duration_ms == pytest.approx(10.0)
+
+    async def test_profile_async_function(self, fake_clock, collector):
+        """Test @profile records coroutine functions under their name."""
+
+        @profile
+        async def async_work():
+            fake_clock.advance(0.01)
+            return "done"
+
+        assert await async_work() == "done"
+
+        results = collector.get_by_name("async_work")
+        assert len(results) == 1
+        assert results[0].duration_ms == pytest.approx(10.0)
+
+    async def test_async_metadata(self, fake_clock, collector):
+        """Test async context carries metadata into the recorded result."""
+        async with async_profile_context("api_call", {"endpoint": "/v1"}) as ctx:
+            fake_clock.advance(0.02)
+
+        assert ctx.duration_ms == pytest.approx(20.0)
+        assert collector.get_by_name("api_call")[0].metadata == {"endpoint": "/v1"}
+
+    async def test_async_profiling_with_error(self, fake_clock, collector):
+        """Test async context records failures and re-raises."""
+        with pytest.raises(RuntimeError, match="down"):
+            async with async_profile_context("flaky_call") as ctx:
+                fake_clock.advance(0.005)
+                raise RuntimeError("down")
+
+        assert not ctx.success
+        assert ctx.error == "down"
+        assert ctx.duration_ms == pytest.approx(5.0)
+        assert not collector.get_by_name("flaky_call")[0].success
+
+    def test_decorator_and_context_integration(self, fake_clock, collector):
+        """Test decorated functions and explicit contexts record together."""
+
+        @profile
+        def step():
+            fake_clock.advance(0.005)
+
+        with ProfilerContext("pipeline"):
+            step()
+            step()
+
+        stats = collector.get_statistics()
+        assert stats["step"]["count"] == 2
+        assert stats["step"]["total_ms"] == pytest.approx(10.0)
+        assert stats["pipeline"]["total_ms"] == pytest.approx(10.0)
+
+
+@pytest.fixture
+def profiling_disabled():
+    """Make @profile call straight through for the duration of a test."""
+    token = _PROFILE_ENABLED.set(False)
+    yield
+    _PROFILE_ENABLED.reset(token)
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("profiling_disabled")
+class TestProfileDecorator:
+    """Tests for @profile behaviour independent of collection."""
+
+    def test_profile_preserves_function_metadata(self):
+        """Test the wrapper keeps the wrapped function's identity."""
+
+        @profile
+        def documented(x: int) -> int:
+            """Double x."""
+            return x * 2
+
+        assert documented.__name__ == "documented"
+        assert documented.__doc__ == "Double x."
+        assert documented(21) == 42
+
+    def test_profile_sync_exception_propagates(self, collector):
+        """Test sync exceptions pass through the decorator unchanged."""
+
+        @profile
+        def failing():
+            raise ValueError("sync failure")
+
+        with pytest.raises(ValueError, match="sync failure"):
+            failing()
+        assert collector.get_results() == []
+
+    async def test_profile_async_exception_propagates(self, collector):
+        """Test async exceptions pass through the decorator unchanged."""
+
+        @profile
+        async def failing():
+            raise ValueError("async failure")
+
+        with pytest.raises(ValueError, match="async failure"):
+            await failing()
+        assert collector.get_results() == []
+
+
+@pytest.mark.unit
+class TestPerformanceCollector:
+    """Tests for the PerformanceCollector singleton."""
+
+    def test_singleton(self, collector):
+        """Test get_instance returns one shared collector."""
+        assert PerformanceCollector.get_instance() is collector
+
+    def test_get_all_results(self, collector):
+        """Test results are returned in recording order."""
+        for result in _SAMPLES:
+            collector.record(result)
+
+        assert collector.get_results() == list(_SAMPLES)
+
+    def test_multiple_recordings(self, collector):
+        """Test repeated recordings of one name are all kept and filterable."""
+        for result in _SAMPLES[1:3] * 2:
+            collector.record(result)
+
+        assert [r.duration_ms for r in collector.get_by_name("op_1")] == [10.0, 10.0]
+        assert collector.get_statistics()["op_2"]["count"] == 2
+
+    def test_success_failure_tracking(self, collector):
+        """Test per-name statistics and success rate."""
+        collector.record(_SAMPLES[1])
+        collector.record(_FAILED)
+
+        assert collector.get_statistics()["op_1"] == {
+            "count": 2,
+            "total_ms": 40.0,
+            "mean_ms": 20.0,
+            "min_ms": 10.0,
+            "max_ms": 30.0,
+            "success_rate": 0.5,
+        }
+
+    def test_disable_skips_recording(self, collector):
+        """Test a disabled collector drops results until re-enabled."""
+        collector.disable()
+        collector.record(_SAMPLES[1])
+        assert collector.get_results() == []
+
+        collector.enable()
+        collector.record(_SAMPLES[1])
+        assert len(collector.get_results()) == 1
+
+    def test_export_json(self, collector, tmp_path):
+        """Test export writes results and statistics."""
+        collector.record(_SAMPLES[1])
+        output_path = tmp_path / "perf" / "results.json"
+
+        collector.export_json(output_path)
+
+        data = json.loads(output_path.read_text())
+        assert data["total_operations"] == 1
+        assert data["statistics"]["op_1"]["count"] == 1
+        assert data["results"][0]["name"] == "op_1"
+
+
+@pytest.mark.unit
+class TestIntegrationScenarios:
+    """End-to-end profiler usage patterns."""
+
+    def test_nested_profiling(self, fake_clock, collector):
+        """Test nested contexts each measure their own span."""
+        with ProfilerContext("outer") as outer:
+            fake_clock.advance(0.01)
+            with ProfilerContext("inner") as inner:
+                fake_clock.advance(0.02)
+
+        assert inner.duration_ms == pytest.approx(20.0)
+        assert outer.duration_ms == pytest.approx(30.0)
+        assert [r.name for r in collector.get_results()] == ["inner", "outer"]
+
+    async def test_concurrent_profiling(self, fake_clock, collector):
+        """Test concurrently running profiled tasks each record a result."""
+
+        @profile
+        async def profiled_task(name: str) -> str:
+            await asyncio.sleep(0)
+            fake_clock.advance(0.01)
+            return name
+
+        # gather rather than TaskGroup: the package supports Python 3.10
+        results = await asyncio.gather(*(profiled_task(f"task{i}") for i in range(1, 4)))
+
+        assert results == ["task1", "task2", "task3"]
+        stats = collector.get_statistics()["profiled_task"]
+        assert stats["count"] == 3
+        assert stats["success_rate"] == 1.0
@@ -4,7 +4,9 @@ Tests verify that summarization results are cached based on content hash + query
 reducing redundant API calls and improving performance.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -13,6 +15,33 @@ from mcp_web.chunker import Chunk
 from mcp_web.summarizer import Summarizer
 
 
+# Slotted stand-ins for OpenAI response objects; cheaper than MagicMock trees
+@dataclass(slots=True)
+class _Delta:
+    content: str
+
+
+@dataclass(slots=True)
+class _StreamChoice:
+    delta: _Delta
+    finish_reason: str | None = None
+
+
+@dataclass(slots=True)
+class _Message:
+    content: str
+
+
+@dataclass(slots=True)
+class _Choice:
+    message: _Message
+
+
+@dataclass(slots=True)
+class _Response:
+    choices: list[Any]
+
+
 @pytest.fixture
 def test_cache(tmp_path):
     """Create a test cache manager."""
@@ -52,20 +81,11 @@ def mock_openai_client():
             """Generate mock streaming chunks."""
             chunks = ["This ", "is ", "a ", "test ", "summary."]
             for chunk_text in chunks:
-                chunk = MagicMock()
-                chunk.choices = [MagicMock()]
-                chunk.choices[0].delta = MagicMock()
-                chunk.choices[0].delta.content = chunk_text
-                chunk.choices[0].finish_reason = None
-                yield chunk
+                yield _Response([_StreamChoice(_Delta(chunk_text))])
 
         # Mock non-streaming response
         def mock_non_stream_response():
-            response = MagicMock()
-            response.choices = [MagicMock()]
-            response.choices[0].message = MagicMock()
-            response.choices[0].message.content = "This is a test summary."
-            return response
+            return _Response([_Choice(_Message("This is a test summary."))])
 
         async def create_completion(**kwargs):
             if kwargs.get("stream", False):
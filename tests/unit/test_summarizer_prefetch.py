@@ -0,0 +1,95 @@
+"""Unit tests for the summarizer's bounded stream prefetch.
+
+Tests verify that ``_prefetch`` preserves order, surfaces producer errors,
+cancels the producer when the consumer stops early, and never buffers more
+than its bound.
+"""
+
+import asyncio
+
+import pytest
+
+from mcp_web.summarizer import _prefetch
+
+
+class _RecordingQueue(asyncio.Queue):
+    """Queue that remembers the most items it ever held."""
+
+    instances: list["_RecordingQueue"] = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.peak = 0
+        _RecordingQueue.instances.append(self)
+
+    def _put(self, item):
+        super()._put(item)
+        self.peak = max(self.peak, self.qsize())
+
+
+async def _numbers(count: int):
+    for number in range(count):
+        yield str(number)
+
+
+@pytest.mark.unit
+class TestPrefetch:
+    """Tests for _prefetch."""
+
+    async def test_preserves_order(self):
+        """Items come out in source order, across many queue refills."""
+        items = [item async for item in _prefetch(_numbers(100), maxsize=4)]
+
+        assert items == [str(number) for number in range(100)]
+
+    async def test_producer_error_reraised(self):
+        """An exception in the source reaches the consumer after prior items."""
+
+        async def failing():
+            yield "a"
+            yield "b"
+            raise RuntimeError("stream broke")
+
+        received = []
+        with pytest.raises(RuntimeError, match="stream broke"):
+            async for item in _prefetch(failing()):
+                received.append(item)
+
+        assert received == ["a", "b"]
+
+    async def test_early_close_cancels_producer(self):
+        """Closing the consumer stops the producer task and closes the source."""
+        closed = asyncio.Event()
+
+        async def endless():
+            try:
+                number = 0
+                while True:
+                    yield str(number)
+                    number += 1
+            finally:
+                closed.set()
+
+        stream = _prefetch(endless(), maxsize=2)
+        assert [await anext(stream), await anext(stream)] == ["0", "1"]
+
+        await stream.aclose()
+
+        assert closed.is_set()
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    async def test_queue_never_exceeds_bound(self, monkeypatch):
+        """A slow consumer leaves the producer blocked at the queue bound."""
+        monkeypatch.setattr(_RecordingQueue, "instances", [])
+        monkeypatch.setattr(asyncio, "Queue", _RecordingQueue)
+
+        items = []
+        async for item in _prefetch(_numbers(50), maxsize=3):
+            items.append(item)
+            # Let the producer run ahead as far as the bound allows
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        (queue,) = _RecordingQueue.instances
+        assert len(items) == 50
+        assert queue.peak == 3
@@ -1,5 +1,7 @@
 """Unit tests for utils module."""
 
+import pytest
+
 from mcp_web.utils import (
     TokenCounter,
     extract_code_blocks,
@@ -10,53 +12,92 @@ from mcp_web.utils import (
 )
 
 
+class FakeEncoder:
+    """Whitespace tokenizer; enough for tests that only compare counts."""
+
+    def encode(self, text):
+        return text.split()
+
+    def encode_batch(self, texts):
+        return [text.split() for text in texts]
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+@pytest.fixture(scope="module")
+def counter():
+    """Shared TokenCounter backed by FakeEncoder, avoiding BPE overhead."""
+    return TokenCounter(encoder=FakeEncoder())
+
+
 class TestTokenCounter:
     """Tests for TokenCounter."""
 
-    def test_count_tokens(self):
+    def test_count_tokens(self, counter):
         """Test token counting."""
-        counter = TokenCounter()
+        hello, hello_world, empty = counter.count_tokens_batch(["Hello", "Hello world", ""])
 
         # Simple text
-        assert counter.count_tokens("Hello") > 0
-        assert counter.count_tokens("Hello world") > counter.count_tokens("Hello")
+        assert hello > 0
+        assert hello_world > hello
 
         # Empty string
-        assert counter.count_tokens("") == 0
+        assert empty == 0
 
-    def test_truncate_to_tokens(self):
-        """Test token truncation."""
-        counter = TokenCounter()
+        # Batch counts match single counts
+        assert counter.count_tokens("Hello world") == hello_world
 
+    def test_truncate_to_tokens(self, counter):
+        """Test token truncation."""
         text = "Hello world, this is a test."
         tokens = counter.count_tokens(text)
 
-        # Truncate to half
+        # Truncate to half, and to more than available
         truncated = counter.truncate_to_tokens(text, tokens // 2)
-        assert counter.count_tokens(truncated) <= tokens // 2
-        assert len(truncated) < len(text)
-
-        # Truncate to more than available
         not_truncated = counter.truncate_to_tokens(text, tokens + 100)
+
+        truncated_tokens, untouched_tokens = counter.count_tokens_batch([truncated, not_truncated])
+        assert truncated_tokens <= tokens // 2
+        assert len(truncated) < len(text)
         assert not_truncated == text
+        assert untouched_tokens == tokens
+
+    def test_encoding_name_real(self):
+        """Test the real tiktoken encoding end to end."""
+        counter = TokenCounter()
+
+        assert counter.encoding_name == "cl100k_base"
+        assert counter.count_tokens("Hello, world!") == 4
+        assert counter.truncate_to_tokens("Hello world", 1) == "Hello"
+
+
+VALID_URLS = [
+    "https://example.com",
+    "http://example.com",
+    "https://example.com/path",
+    "https://example.com:8080/path?query=1",
+]
+INVALID_URLS = [
+    "not a url",
+    "ftp://example.com",  # Wrong scheme
+    "javascript:alert(1)",
+    "",
+]
 
 
 class TestURLValidation:
     """Tests for URL validation."""
 
-    def test_validate_url_valid(self):
+    @pytest.mark.parametrize("url", VALID_URLS)
+    def test_validate_url_valid(self, url):
         """Test valid URLs."""
-        assert validate_url("https://example.com")
-        assert validate_url("http://example.com")
-        assert validate_url("https://example.com/path")
-        assert validate_url("https://example.com:8080/path?query=1")
+        assert validate_url(url)
 
-    def test_validate_url_invalid(self):
+    @pytest.mark.parametrize("url", INVALID_URLS)
+    def test_validate_url_invalid(self, url):
         """Test invalid URLs."""
-        assert not validate_url("not a url")
-        assert not validate_url("ftp://example.com")  # Wrong scheme
-        assert not validate_url("javascript:alert(1)")
-        assert not validate_url("")
+        assert not validate_url(url)
 
     def test_normalize_url(self):
         """Test URL normalization."""
@@ -94,12 +135,7 @@ class TestMarkdownFormatting:
         assert "## Sources" not in summary
 
 
-class TestCodeExtraction:
-    """Tests for code extraction."""
-
-    def test_extract_code_blocks(self):
-        """Test code block extraction."""
-        markdown = """
+_TWO_CODE_BLOCKS = """
 Some text
 
 ```python
@@ -113,7 +149,13 @@ console.log('world');
 ```
 """
 
-        blocks = extract_code_blocks(markdown)
+
+class TestCodeExtraction:
+    """Tests for code extraction."""
+
+    def test_extract_code_blocks(self):
+        """Test code block extraction."""
+        blocks = extract_code_blocks(_TWO_CODE_BLOCKS)
         assert len(blocks) == 2
         assert blocks[0][0] == "python"
         assert "print" in blocks[0][1]
@@ -5,7 +5,7 @@ Tests validation of frontmatter fields, status consistency, success criteria,
 and phase integrity per Initiative System Lifecycle Improvements (2025-10-19).
 """
 
-import tempfile
+import shutil
 from pathlib import Path
 
 import pytest
@@ -13,20 +13,48 @@ import pytest
 from scripts.validation.validate_initiatives import InitiativeValidator
 
 
-@pytest.fixture
-def temp_initiatives_dir():
-    """Create temporary initiatives directory structure."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        (base / "active").mkdir()
-        (base / "completed").mkdir()
-        yield base
+def _make_initiatives_dir(base: Path) -> Path:
+    """Create the active/ and completed/ initiative folders under ``base``."""
+    (base / "active").mkdir()
+    (base / "completed").mkdir()
+    return base
+
+
+def _messages_by_severity(results) -> dict[str, list[str]]:
+    """Group result messages by severity in a single pass.
+
+    Only info results are reported as passed, so the critical and warning
+    groups hold failures only.
+    """
+    index: dict[str, list[str]] = {}
+    for result in results:
+        index.setdefault(result.severity, []).append(result.message)
+    return index
+
+
+@pytest.fixture(scope="module")
+def temp_initiatives_dir(tmp_path_factory):
+    """Temporary initiatives directory shared by the module's tests.
+
+    Tests write uniquely named files (see ``initiative_file``), so they do
+    not see each other's initiatives.
+    """
+    return _make_initiatives_dir(tmp_path_factory.mktemp("initiatives"))
+
+
+@pytest.fixture(scope="module")
+def validator(temp_initiatives_dir):
+    """Shared validator; validate_file resets its results on every call."""
+    return InitiativeValidator(temp_initiatives_dir)
 
 
 @pytest.fixture
-def valid_initiative_content():
-    """Valid initiative file content with all required fields."""
-    return """---
+def initiative_file(temp_initiatives_dir, request):
+    """Path in active/ named after the requesting test."""
+    return temp_initiatives_dir / "active" / f"{request.node.name}.md"
+
+
+_VALID_INITIATIVE = """---
 Status: Active
 Created: 2025-10-19
 Owner: Test User
@@ -53,11 +81,7 @@ Test objective here.
 - [ ] Task 2
 """
 
-
-@pytest.fixture
-def completed_initiative_content():
-    """Completed initiative content."""
-    return """---
+_COMPLETED_INITIATIVE = """---
 Status: Completed
 Created: 2025-10-15
 Completed: 2025-10-18
@@ -79,25 +103,27 @@ Priority: High
 """
 
 
-class TestInitiativeValidator:
-    """Test InitiativeValidator class."""
+@pytest.fixture(scope="module")
+def valid_initiative_content():
+    """Valid initiative file content with all required fields."""
+    return _VALID_INITIATIVE
 
-    def test_validate_valid_initiative(self, temp_initiatives_dir, valid_initiative_content):
-        """Test validation passes for valid initiative."""
-        # Create test file
-        test_file = temp_initiatives_dir / "active" / "test-initiative.md"
-        test_file.write_text(valid_initiative_content)
 
-        validator = InitiativeValidator(temp_initiatives_dir)
-        results = validator.validate_file(test_file)
+@pytest.fixture(scope="module")
+def valid_initiative_path(tmp_path_factory, valid_initiative_content):
+    """Valid initiative written once; tests copy it with shutil.copyfile."""
+    path = tmp_path_factory.mktemp("golden") / "valid.md"
+    path.write_text(valid_initiative_content)
+    return path
 
-        # Should have no critical or warning failures
-        critical_failures = [r for r in results if r.severity == "critical" and not r.passed]
-        assert len(critical_failures) == 0, f"Unexpected critical failures: {critical_failures}"
 
-    def test_missing_required_field(self, temp_initiatives_dir):
-        """Test validation fails when required field is missing."""
-        content = """---
+@pytest.fixture(scope="module")
+def completed_initiative_content():
+    """Completed initiative content."""
+    return _COMPLETED_INITIATIVE
+
+
+_MISSING_REQUIRED = """---
 Created: 2025-10-19
 Owner: Test User
 # Missing Status and Priority
@@ -105,21 +131,8 @@ Owner: Test User
 
 # Test Initiative
 """
-        test_file = temp_initiatives_dir / "active" / "test-initiative.md"
-        test_file.write_text(content)
-
-        validator = InitiativeValidator(temp_initiatives_dir)
-        results = validator.validate_file(test_file)
-
-        # Should have critical failures for missing Status and Priority
-        critical_failures = [r for r in results if r.severity == "critical" and not r.passed]
-        assert len(critical_failures) >= 2
-        assert any("Status" in r.message for r in critical_failures)
-        assert any("Priority" in r.message for r in critical_failures)
 
-    def test_invalid_date_format(self, temp_initiatives_dir):
-        """Test validation warns on invalid date format."""
-        content = """---
+_INVALID_DATE = """---
 Status: Active
 Created: 10/19/2025
 Owner: Test User
@@ -128,31 +141,8 @@ Priority: High
 
 # Test Initiative
 """
-        test_file = temp_initiatives_dir / "active" / "test-initiative.md"
-        test_file.write_text(content)
-
-        validator = InitiativeValidator(temp_initiatives_dir)
-        results = validator.validate_file(test_file)
-
-        # Should have warning for invalid date format
-        warnings = [r for r in results if r.severity == "warning" and not r.passed]
-        assert any("YYYY-MM-DD" in r.message for r in warnings)
-
-    def test_status_location_mismatch(self, temp_initiatives_dir, completed_initiative_content):
-        """Test validation fails when completed initiative is in active directory."""
-        test_file = temp_initiatives_dir / "active" / "test-initiative.md"
-        test_file.write_text(completed_initiative_content)
-
-        validator = InitiativeValidator(temp_initiatives_dir)
-        results = validator.validate_file(test_file)
-
-        # Should have critical failure for status-location mismatch
-        critical_failures = [r for r in results if r.severity == "critical" and not r.passed]
-        assert any("completed/" in r.message.lower() for r in critical_failures)
 
-    def test_active_without_unchecked_tasks(self, temp_initiatives_dir):
-        """Test validation warns when active initiative has no unchecked tasks."""
-        content = """---
+_ACTIVE_ALL_CHECKED = """---
 Status: Active
 Created: 2025-10-19
 Owner: Test User
@@ -166,19 +156,8 @@ Priority: High
 - [x] Task 1
 - [x] Task 2
 """
-        test_file = temp_initiatives_dir / "active" / "test-initiative.md"
-        test_file.write_text(content)
-
-        validator = InitiativeValidator(temp_initiatives_dir)
-        results = validator.validate_file(test_file)
-
-        # Should have warning suggesting completion
-        warnings = [r for r in results if r.severity == "warning" and not r.passed]
-        assert any("completed" in r.message.lower() for r in warnings)
 
-    def test_missing_success_criteria(self, temp_initiatives_dir):
-        """Test validation warns when success criteria section is missing."""
-        content = """---
+_NO_SUCCESS_CRITERIA = """---
 Status: Active
 Created: 2025-10-19
 Owner: Test User
@@ -195,26 +174,93 @@ Test objective.
 
 - [ ] Task 1
 """
-        test_file = temp_initiatives_dir / "active" / "test-initiative.md"
-        test_file.write_text(content)
 
-        validator = InitiativeValidator(temp_initiatives_dir)
+_INVALID_STATUS = """---
+Status: InProgress
+Created: 2025-10-19
+Owner: Test User
+Priority: High
+---
+
+# Test Initiative
+"""
+
+_ONLY_REQUIRED_FIELDS = """---
+Status: Active
+Created: 2025-10-19
+Owner: Test User
+Priority: High
+---
+
+# Test Initiative
+"""
+
+# (content, severity, substrings that must each appear in a message of that severity)
+VALIDATION_CASES = [
+    pytest.param(_MISSING_REQUIRED, "critical", ("Status", "Priority"), id="missing-required"),
+    pytest.param(_INVALID_DATE, "warning", ("YYYY-MM-DD",), id="invalid-date"),
+    pytest.param(_ACTIVE_ALL_CHECKED, "warning", ("Completed",), id="active-all-checked"),
+    pytest.param(_NO_SUCCESS_CRITERIA, "warning", ("Success Criteria",), id="no-success-criteria"),
+    pytest.param(_INVALID_STATUS, "warning", ("Invalid Status value",), id="invalid-status"),
+    pytest.param(
+        _ONLY_REQUIRED_FIELDS,
+        "info",
+        ("Estimated Duration", "Target Completion", "Updated"),
+        id="recommended-fields",
+    ),
+]
+
+
+class TestInitiativeValidator:
+    """Test InitiativeValidator class."""
+
+    def test_validate_valid_initiative(self, initiative_file, validator, valid_initiative_path):
+        """Test validation passes for valid initiative."""
+        # Create test file
+        test_file = initiative_file
+        shutil.copyfile(valid_initiative_path, test_file)
+
+        results = validator.validate_file(test_file)
+
+        # Should have no critical or warning failures
+        critical_failures = _messages_by_severity(results).get("critical", [])
+        assert not critical_failures, f"Unexpected critical failures: {critical_failures}"
+
+    def test_status_location_mismatch(
+        self, initiative_file, validator, completed_initiative_content
+    ):
+        """Test validation fails when completed initiative is in active directory."""
+        test_file = initiative_file
+        test_file.write_text(completed_initiative_content)
+
         results = validator.validate_file(test_file)
 
-        # Should have warning for missing success criteria
-        warnings = [r for r in results if r.severity == "warning" and not r.passed]
-        assert any("success criteria" in r.message.lower() for r in warnings)
+        # Should have critical failure for status-location mismatch
+        critical_failures = _messages_by_severity(results).get("critical", [])
+        assert any("completed/" in message.lower() for message in critical_failures)
+
+    @pytest.mark.parametrize(("content", "severity", "needles"), VALIDATION_CASES)
+    def test_validation_case(self, initiative_file, validator, content, severity, needles):
+        """Test each frontmatter/content problem is reported at its severity."""
+        initiative_file.write_text(content)
+
+        results = validator.validate_file(initiative_file)
 
-    def test_validate_all_initiatives(self, temp_initiatives_dir, valid_initiative_content):
+        messages = _messages_by_severity(results).get(severity, [])
+        for needle in needles:
+            assert any(needle in message for message in messages), (needle, messages)
+
+    def test_validate_all_initiatives(self, tmp_path, valid_initiative_path):
         """Test validate_all finds and validates multiple initiatives."""
-        # Create multiple test files
-        (temp_initiatives_dir / "active" / "init1.md").write_text(valid_initiative_content)
-        (temp_initiatives_dir / "active" / "init2.md").write_text(valid_initiative_content)
+        # validate_all walks the whole tree, so use a directory of its own
+        temp_initiatives_dir = _make_initiatives_dir(tmp_path)
 
-        # Create folder-based initiative
-        folder_init = temp_initiatives_dir / "active" / "2025-10-19-folder-init"
+        # Create two flat initiatives and one folder-based initiative
+        active = temp_initiatives_dir / "active"
+        folder_init = active / "2025-10-19-folder-init"
         folder_init.mkdir()
-        (folder_init / "initiative.md").write_text(valid_initiative_content)
+        for path in (active / "init1.md", active / "init2.md", folder_init / "initiative.md"):
+            shutil.copyfile(valid_initiative_path, path)
 
         validator = InitiativeValidator(temp_initiatives_dir)
         all_results = validator.validate_all()
@@ -222,69 +268,22 @@ Test objective.
         # Should find all 3 initiatives
         assert len(all_results) == 3
 
-    def test_folder_based_with_phases(self, temp_initiatives_dir, valid_initiative_content):
+    def test_folder_based_with_phases(self, temp_initiatives_dir, validator, valid_initiative_path):
         """Test validation checks for phases directory in folder-based initiatives."""
         folder_init = temp_initiatives_dir / "active" / "2025-10-19-test-init"
         folder_init.mkdir()
-        (folder_init / "initiative.md").write_text(valid_initiative_content)
+        shutil.copyfile(valid_initiative_path, folder_init / "initiative.md")
 
         # Create empty phases directory
         (folder_init / "phases").mkdir()
 
-        validator = InitiativeValidator(temp_initiatives_dir)
         results = validator.validate_file(folder_init / "initiative.md")
 
         # Should have info message about empty phases directory
-        infos = [r for r in results if r.severity == "info"]
-        assert any("phases/" in r.message and "empty" in r.message for r in infos)
-
-    def test_invalid_status_value(self, temp_initiatives_dir):
-        """Test validation warns on invalid status value."""
-        content = """---
-Status: InProgress
-Created: 2025-10-19
-Owner: Test User
-Priority: High
----
-
-# Test Initiative
-"""
-        test_file = temp_initiatives_dir / "active" / "test-initiative.md"
-        test_file.write_text(content)
+        infos = _messages_by_severity(results).get("info", [])
+        assert any("phases/" in message and "empty" in message for message in infos)
 
-        validator = InitiativeValidator(temp_initiatives_dir)
-        results = validator.validate_file(test_file)
-
-        # Should have warning for invalid status
-        warnings = [r for r in results if r.severity == "warning" and not r.passed]
-        assert any(
-            "status" in r.message.lower() and "invalid" in r.message.lower() for r in warnings
-        )
-
-    def test_recommended_fields(self, temp_initiatives_dir):
-        """Test validation provides info on missing recommended fields."""
-        content = """---
-Status: Active
-Created: 2025-10-19
-Owner: Test User
-Priority: High
----
-
-# Test Initiative
-"""
-        test_file = temp_initiatives_dir / "active" / "test-initiative.md"
-        test_file.write_text(content)
-
-        validator = InitiativeValidator(temp_initiatives_dir)
-        results = validator.validate_file(test_file)
-
-        # Should have info about missing recommended fields
-        infos = [r for r in results if r.severity == "info"]
-        recommended_fields = ["Estimated Duration", "Target Completion", "Updated"]
-        for field in recommended_fields:
-            assert any(field in r.message for r in infos)
-
-    def test_malformed_frontmatter(self, temp_initiatives_dir):
+    def test_malformed_frontmatter(self, initiative_file, validator):
         """Test handling of malformed YAML frontmatter."""
         content = """---
 Status Active
@@ -294,30 +293,28 @@ Invalid::YAML::[Here
 
 # Test
 """
-        test_file = temp_initiatives_dir / "active" / "test.md"
+        test_file = initiative_file
         test_file.write_text(content)
 
-        validator = InitiativeValidator(temp_initiatives_dir)
         results = validator.validate_file(test_file)
 
         # Should have error about YAML parsing
         failures = [r for r in results if not r.passed]
         assert len(failures) > 0
 
-    def test_no_frontmatter(self, temp_initiatives_dir):
+    def test_no_frontmatter(self, initiative_file, validator):
         """Test file without frontmatter."""
         content = "# Just a title\n\nNo frontmatter here."
-        test_file = temp_initiatives_dir / "active" / "test.md"
+        test_file = initiative_file
         test_file.write_text(content)
 
-        validator = InitiativeValidator(temp_initiatives_dir)
         results = validator.validate_file(test_file)
 
         # Should have failures (critical or otherwise)
         failures = [r for r in results if not r.passed]
         assert len(failures) > 0
 
-    def test_unicode_in_content(self, temp_initiatives_dir):
+    def test_unicode_in_content(self, initiative_file, validator):
         """Test handling of unicode characters."""
         content = """---
 Status: Active
@@ -331,32 +328,29 @@ Priority: High
 ## Objective
 Test with émojis and spëcial çharacters.
 """
-        test_file = temp_initiatives_dir / "active" / "test.md"
+        test_file = initiative_file
         test_file.write_text(content, encoding="utf-8")
 
-        validator = InitiativeValidator(temp_initiatives_dir)
         results = validator.validate_file(test_file)
 
         # Should not crash, validation runs
         assert isinstance(results, list)
 
-    def test_empty_file(self, temp_initiatives_dir):
+    def test_empty_file(self, initiative_file, validator):
         """Test validation of empty file."""
-        test_file = temp_initiatives_dir / "active" / "empty.md"
+        test_file = initiative_file
         test_file.write_text("")
 
-        validator = InitiativeValidator(temp_initiatives_dir)
         results = validator.validate_file(test_file)
 
         # Should have critical failures
-        critical = [r for r in results if r.severity == "critical" and not r.passed]
+        critical = _messages_by_severity(results).get("critical", [])
         assert len(critical) > 0
 
-    def test_file_not_found(self, temp_initiatives_dir):
+    def test_file_not_found(self, initiative_file, validator):
         """Test validation of non-existent file."""
-        test_file = temp_initiatives_dir / "active" / "nonexistent.md"
+        test_file = initiative_file
 
-        validator = InitiativeValidator(temp_initiatives_dir)
         results = validator.validate_file(test_file)
 
         # Should handle gracefully (empty results or error message)
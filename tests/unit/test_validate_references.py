@@ -8,15 +8,20 @@ Tests internal markdown link validation including:
 - External link ignoring
 """
 
+import shutil
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def temp_docs_dir(tmp_path: Path) -> Path:
-    """Create temporary docs directory structure for testing."""
-    docs = tmp_path / "docs"
+@pytest.fixture(scope="module")
+def temp_docs_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create temporary docs directory structure, shared read-only by the module.
+
+    Tests that need to add files copy the tree first (see
+    ``test_validate_directory_reports_every_occurrence``).
+    """
+    docs = tmp_path_factory.mktemp("refs") / "docs"
     docs.mkdir()
 
     # Create test files
@@ -76,9 +81,9 @@ class TestMarkdownLinkExtraction:
         links = extract_markdown_links(text)
 
         assert len(links) == 1
-        assert links[0]["text"] == "Example"
-        assert links[0]["url"] == "./file.md"
-        assert links[0]["line"] == 0
+        assert links[0].text == "Example"
+        assert links[0].url == "./file.md"
+        assert links[0].line == 0
 
     def test_extract_multiple_links(self):
         """Extract multiple links from same line."""
@@ -88,8 +93,8 @@ class TestMarkdownLinkExtraction:
         links = extract_markdown_links(text)
 
         assert len(links) == 2
-        assert links[0]["url"] == "./file1.md"
-        assert links[1]["url"] == "./file2.md"
+        assert links[0].url == "./file1.md"
+        assert links[1].url == "./file2.md"
 
     def test_extract_link_with_anchor(self):
         """Extract link with section anchor."""
@@ -99,8 +104,8 @@ class TestMarkdownLinkExtraction:
         links = extract_markdown_links(text)
 
         assert len(links) == 1
-        assert links[0]["url"] == "./file.md#heading"
-        assert "#heading" in links[0]["url"]
+        assert links[0].url == "./file.md#heading"
+        assert "#heading" in links[0].url
 
     def test_ignore_external_links(self):
         """External URLs should not be extracted."""
@@ -115,7 +120,7 @@ class TestMarkdownLinkExtraction:
 
         # Only internal link should be extracted
         assert len(links) == 1
-        assert links[0]["url"] == "./file.md"
+        assert links[0].url == "./file.md"
 
     def test_ignore_code_blocks(self):
         """Links in code blocks should be ignored."""
@@ -134,8 +139,8 @@ class TestMarkdownLinkExtraction:
 
         # Should only extract links outside code blocks
         assert len(links) == 2
-        assert links[0]["url"] == "./file.md"
-        assert links[1]["url"] == "./file2.md"
+        assert links[0].url == "./file.md"
+        assert links[1].url == "./file2.md"
 
     def test_extract_with_line_numbers(self):
         """Links should include correct line numbers."""
@@ -148,8 +153,8 @@ Line 2
 """
         links = extract_markdown_links(text)
 
-        assert links[0]["line"] == 1
-        assert links[1]["line"] == 3
+        assert links[0].line == 1
+        assert links[1].line == 3
 
 
 class TestPathResolution:
@@ -246,16 +251,54 @@ More content.
         # Special chars removed in anchor generation (& becomes nothing)
         assert validate_anchor(content, "testing-validation") is True
 
+    def test_anchor_cache_keyed_by_digest(self, monkeypatch):
+        """Cached anchors are keyed by a content digest, not the content."""
+        from scripts.validation import validate_references
+
+        monkeypatch.setattr(validate_references, "_slug_cache", {})
+        content = "# Cached Heading\n" + "body\n" * 1000
+
+        assert validate_references.validate_anchor(content, "cached-heading") is True
+        assert validate_references.validate_anchor(content, "other") is False
+
+        (key,) = validate_references._slug_cache
+        assert len(key) == 8
+        assert validate_references._slug_cache[key] == {"cached-heading"}
+
+    def test_anchor_cache_bounded(self, monkeypatch):
+        """The anchor cache is emptied rather than grown past its bound."""
+        from scripts.validation import validate_references
+
+        monkeypatch.setattr(validate_references, "_slug_cache", {})
+        monkeypatch.setattr(validate_references, "_SLUG_CACHE_SIZE", 2)
+
+        for index in range(3):
+            assert validate_references.validate_anchor(f"# H{index}", f"h{index}") is True
+
+        assert len(validate_references._slug_cache) == 1
+
+    def test_large_file_anchors_match_text_path(self, tmp_path: Path, monkeypatch):
+        """Anchors parsed from an mmap-ed file match the in-memory parser."""
+        from scripts.validation import validate_references
+
+        target = tmp_path / "large.md"
+        target.write_text("# Überblick\r\n\n## Testing & Validation\nbody\n###   Spaced Out  \n")
+        expected = validate_references._load_anchor_set(target)
+
+        monkeypatch.setattr(validate_references, "_MMAP_MIN_SIZE", 1)
+        assert validate_references._load_anchor_set(target) == expected
+        assert "testing-validation" in expected
+
 
 class TestLinkValidation:
     """Test full link validation workflow."""
 
     def test_validate_valid_file_link(self, temp_docs_dir: Path):
         """Valid link to existing file should pass."""
-        from scripts.validation.validate_references import validate_link
+        from scripts.validation.validate_references import Link, validate_link
 
         source = temp_docs_dir / "README.md"
-        link = {"url": "./guide.md", "text": "Guide", "line": 1}
+        link = Link(text="Guide", url="./guide.md", line=1)
 
         result = validate_link(source, link, root=temp_docs_dir.parent)
 
@@ -264,10 +307,10 @@ class TestLinkValidation:
 
     def test_validate_broken_file_link(self, temp_docs_dir: Path):
         """Invalid link to non-existent file should fail."""
-        from scripts.validation.validate_references import validate_link
+        from scripts.validation.validate_references import Link, validate_link
 
         source = temp_docs_dir / "README.md"
-        link = {"url": "./nonexistent.md", "text": "Broken", "line": 1}
+        link = Link(text="Broken", url="./nonexistent.md", line=1)
 
         result = validate_link(source, link, root=temp_docs_dir.parent)
 
@@ -276,10 +319,10 @@ class TestLinkValidation:
 
     def test_validate_valid_anchor_link(self, temp_docs_dir: Path):
         """Valid link with anchor to existing section should pass."""
-        from scripts.validation.validate_references import validate_link
+        from scripts.validation.validate_references import Link, validate_link
 
         source = temp_docs_dir / "README.md"
-        link = {"url": "./guide.md#section-one", "text": "Guide", "line": 1}
+        link = Link(text="Guide", url="./guide.md#section-one", line=1)
 
         result = validate_link(source, link, root=temp_docs_dir.parent)
 
@@ -287,10 +330,10 @@ class TestLinkValidation:
 
     def test_validate_broken_anchor_link(self, temp_docs_dir: Path):
         """Link with invalid anchor should fail."""
-        from scripts.validation.validate_references import validate_link
+        from scripts.validation.validate_references import Link, validate_link
 
         source = temp_docs_dir / "README.md"
-        link = {"url": "./guide.md#nonexistent", "text": "Guide", "line": 1}
+        link = Link(text="Guide", url="./guide.md#nonexistent", line=1)
 
         result = validate_link(source, link, root=temp_docs_dir.parent)
 
@@ -311,6 +354,18 @@ class TestScriptIntegration:
         assert any(f.name == "README.md" for f in files)
         assert any(f.name == "guide.md" for f in files)
 
+    def test_scan_missing_directory(self, tmp_path: Path):
+        """A missing directory scans as empty, as Path.rglob does."""
+        from scripts.validation.validate_references import (
+            scan_markdown_files,
+            validate_directory,
+        )
+
+        missing = tmp_path / "does-not-exist"
+
+        assert scan_markdown_files(missing) == []
+        assert validate_directory(missing, root=tmp_path) == []
+
     def test_validate_directory_with_errors(self, temp_docs_dir: Path):
         """Validate directory and detect broken links."""
         from scripts.validation.validate_references import validate_directory
@@ -328,6 +383,45 @@ class TestScriptIntegration:
         assert "link" in error
         assert "error" in error
 
+    def test_validate_directory_reports_every_occurrence(self, temp_docs_dir: Path, tmp_path: Path):
+        """Links sharing a target are checked once but each occurrence is reported."""
+        from scripts.validation.validate_references import validate_directory
+
+        docs = shutil.copytree(temp_docs_dir, tmp_path / "docs")
+        (docs / "repeat.md").write_text(
+            """[One](./missing.md)
+[Two](./guide.md#nope)
+[Three](./missing.md#section-one)
+[Four](./guide.md#section-two)
+"""
+        )
+
+        errors = [
+            e for e in validate_directory(docs, root=tmp_path) if e["file"].endswith("repeat.md")
+        ]
+
+        assert [e["line"] for e in errors] == [1, 2, 3]
+        assert "does not exist" in errors[0]["error"].lower()
+        assert "anchor" in errors[1]["error"].lower()
+        assert errors[2]["error"] == errors[0]["error"]
+
+    def test_validate_directory_many_targets(self, tmp_path: Path):
+        """Trees with many targets (checked on the thread pool) keep line order."""
+        from scripts.validation.validate_references import validate_directory
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        for i in range(0, 12, 2):
+            (docs / f"page{i}.md").write_text(f"# Page {i}\n")
+        (docs / "index.md").write_text(
+            "\n".join(f"[P{i}](./page{i}.md#page-{i})" for i in range(12))
+        )
+
+        errors = validate_directory(docs, root=tmp_path)
+
+        assert [e["line"] for e in errors] == [2, 4, 6, 8, 10, 12]
+        assert all("does not exist" in e["error"].lower() for e in errors)
+
     def test_generate_report(self, temp_docs_dir: Path):
         """Generate human-readable error report."""
         from scripts.validation.validate_references import generate_report, validate_directory
@@ -356,6 +450,7 @@ class TestIgnorePatterns:
         assert should_ignore_link("https://example.com") is True
         assert should_ignore_link("http://example.org") is True
         assert should_ignore_link("mailto:test@example.com") is True
+        assert should_ignore_link("tel:+15555550100") is True
 
     def test_allow_internal_links(self):
         """Internal relative links should not be ignored."""